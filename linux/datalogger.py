@@ -2,10 +2,15 @@
 """
 TriSonica Data Logger for Linux
 Optimized for Linux desktop and server environments with systemd integration
+
+Supports free-threaded CPython (python3.13t, PYTHON_GIL=0): the serial reader
+thread only hands lines to the main thread through a queue.SimpleQueue, all
+parsing, statistics and rendering state is owned by the main thread.
 """
 
 import serial
 import datetime
+import csv
 import time
 import sys
 import signal
@@ -15,31 +20,61 @@ import glob
 import argparse
 import platform
 import subprocess
+import threading
+import queue
+import asyncio
 from collections import deque
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, TYPE_CHECKING
 from dataclasses import dataclass, field
 from pathlib import Path
 
-# Linux optimized imports
+# Linux optimized imports, the remaining rich UI modules are imported where
+# the interactive display is built so headless startup stays light
 from rich.console import Console
-from rich.live import Live
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.text import Text
-from rich.align import Align
-from rich import box
-from rich.columns import Columns
-from rich.tree import Tree
-from rich.sparkline import Sparkline
-from rich.bar import Bar
+
+if TYPE_CHECKING:
+    from rich.layout import Layout
+    from rich.live import Live
+    from rich.panel import Panel
+
+# Optional asyncio serial transport, falls back to the reader thread
+try:
+    import serial_asyncio
+except ImportError:
+    serial_asyncio = None
 
 # --- Configuration ---
 DEFAULT_BAUD_RATE = 115200
 MAX_DATAPOINTS = 1500  # Balanced for Linux systems
-UPDATE_INTERVAL = 0.05  # Fast updates for Linux
+UPDATE_INTERVAL = 0.1  # 10 Hz display refresh, serial reads are not tied to it
 LOG_ROTATION_SIZE = 50 * 1024 * 1024  # 50MB logs
+LOG_BUFFER_SIZE = 1 << 20  # 1MB write buffer for the data log
+LOG_FLUSH_INTERVAL = 100  # Flush the data log every N points
+MEMORY_SAMPLE_FRAMES = max(1, round(1 / UPDATE_INTERVAL))  # Sample memory usage about once a second
+
+# Auto-detection probe
+DETECT_TIMEOUT = 0.5  # Seconds to listen on each candidate port
+DETECT_READ_SIZE = 1024
+DETECT_TOKENS = (b'S1', b'S2', b'S3', b'T1', b'T2')
+
+CPUINFO_READ_SIZE = 4096  # /proc/cpuinfo repeats per core, read only the head
+
+READER_NICE_DELTA = -5  # Priority boost for a pinned reader (needs CAP_SYS_NICE)
+
+# "KEY value" pairs in both comma and whitespace separated frames
+PAIR_PATTERN = re.compile(r'([^\s,]+)\s+([^\s,]+)')
+
+def python_version_label() -> str:
+    """Python version, flagged when running free-threaded with the GIL disabled"""
+    version = sys.version.split()[0]
+    if not getattr(sys, '_is_gil_enabled', lambda: True)():
+        version += " (free-threaded)"
+    return version
+
+def ns_to_datetime(timestamp_ns: int) -> datetime.datetime:
+    """Convert a time.time_ns() value to a local datetime with microsecond precision"""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
 
 @dataclass
 class Config:
@@ -51,12 +86,14 @@ class Config:
     plot_enabled: bool = False
     max_log_size: int = LOG_ROTATION_SIZE
     enable_notifications: bool = True
+    pin_core: Optional[int] = None
 
 @dataclass
 class DataPoint:
-    timestamp: datetime.datetime
+    timestamp_ns: int  # Wall clock time from time.time_ns()
     raw_data: str
     parsed_data: Dict[str, str] = field(default_factory=dict)
+    parsed_values: Dict[str, float] = field(default_factory=dict)  # Numeric subset of parsed_data
 
 @dataclass
 class Statistics:
@@ -66,9 +103,68 @@ class Statistics:
     current_val: float = 0.0
     std_dev: float = 0.0
     count: int = 0
-    values: deque = field(default_factory=lambda: deque(maxlen=150))
+    m2: float = 0.0  # Running sum of squared deviations (Welford)
+
+class DataPointRing:
+    """Fixed-size ring of preallocated DataPoint slots that are overwritten in place"""
+    def __init__(self, size: int):
+        self._slots = [DataPoint(0, '') for _ in range(size)]
+        self._size = size
+        self._head = 0  # Total number of committed points
+        
+    def __len__(self) -> int:
+        return min(self._head, self._size)
+        
+    def __getitem__(self, index: int) -> DataPoint:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("DataPointRing index out of range")
+        return self._slots[(self._head - length + index) % self._size]
+        
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self._slots)
+        
+    def claim(self) -> DataPoint:
+        """Return the slot the next point will be written to"""
+        return self._slots[self._head % self._size]
+        
+    def commit(self):
+        """Publish the claimed slot as the newest point"""
+        self._head += 1
+        
+    def recent(self, count: int) -> List[DataPoint]:
+        """Newest points, oldest first"""
+        length = len(self)
+        return [self[i] for i in range(max(0, length - count), length)]
+
+class SerialLineProtocol(asyncio.Protocol):
+    """asyncio protocol feeding received serial chunks into the logger"""
+    def __init__(self, logger: 'TrisonicaDataLoggerLinux'):
+        self.logger = logger
+        
+    def data_received(self, data: bytes):
+        self.logger.handle_chunk(data)
+        
+    def connection_lost(self, exc: Optional[Exception]):
+        self.logger.running = False
 
 class TrisonicaDataLoggerLinux:
+    # Parameter key -> visualization series it feeds
+    VIZ_MAP = {
+        'S': 'wind_speed',
+        'S2': 'wind_speed',
+        'T': 'temperature',
+        'D': 'wind_direction'
+    }
+    
+    # Parameter key prefix -> (unit, valid min, valid max) for the quality column
+    QUALITY_RANGES = {
+        'S': ("m/s", 0, 50),
+        'T': ("°C", -40, 60)
+    }
+    
     def __init__(self, config: Config):
         self.config = config
         self.serial_port = None
@@ -79,7 +175,7 @@ class TrisonicaDataLoggerLinux:
         self.start_time = time.time()
         
         # Data storage
-        self.data_points = deque(maxlen=MAX_DATAPOINTS)
+        self.data_points = DataPointRing(MAX_DATAPOINTS)
         self.point_count = 0
         self.stats = {}
         
@@ -92,6 +188,24 @@ class TrisonicaDataLoggerLinux:
         self.update_rate = 0.0
         self.system_info = self.get_system_info()
         
+        # Display sections that need rebuilding on the next frame
+        self._current_dirty = True
+        self._raw_dirty = True
+        self._stats_dirty = True
+        self._frame_count = 0
+        self._memory_usage = ""
+        
+        # Serial reader thread hands (timestamp_ns, line) tuples to the main loop.
+        # The queue is the only state shared between the two threads, the
+        # residual buffer belongs to whichever thread is reading the port.
+        self._rx_queue = queue.SimpleQueue()
+        self._reader_thread = None
+        self._rx_residual = b''
+        
+        # CSV timestamp formatting, the seconds prefix is cached per second
+        self._ts_second = None
+        self._ts_prefix = ""
+        
         # Visualization data storage
         self.viz_data = {
             'wind_speed': deque(maxlen=75),
@@ -116,54 +230,46 @@ class TrisonicaDataLoggerLinux:
 
     def get_system_info(self) -> Dict[str, str]:
         """Get Linux system information"""
+        # Hostname and kernel version come from a single uname() call
+        uname = os.uname()
+        
+        # Get distribution info
+        distro = None
         try:
-            # Get distribution info
-            try:
-                with open('/etc/os-release', 'r') as f:
-                    os_info = f.read()
-                    distro = 'Unknown'
-                    for line in os_info.split('\n'):
-                        if line.startswith('PRETTY_NAME='):
-                            distro = line.split('=', 1)[1].strip('"')
-                            break
-            except:
-                distro = platform.platform()
-            
-            # Get hostname
-            hostname = platform.node()
-            
-            # Get kernel version
-            kernel = platform.release()
-            
-            # Get CPU info
-            try:
-                with open('/proc/cpuinfo', 'r') as f:
-                    cpu_info = f.read()
-                    cpu_model = 'Unknown'
-                    for line in cpu_info.split('\n'):
-                        if line.startswith('model name'):
-                            cpu_model = line.split(':', 1)[1].strip()
-                            break
-            except:
-                cpu_model = platform.processor()
-            
-            return {
-                'hostname': hostname,
-                'distro': distro,
-                'kernel': kernel,
-                'cpu': cpu_model,
-                'platform': 'Linux',
-                'python_version': sys.version.split()[0]
-            }
-        except:
-            return {
-                'hostname': platform.node(),
-                'distro': 'Unknown Linux',
-                'kernel': platform.release(),
-                'cpu': 'Unknown',
-                'platform': 'Linux',
-                'python_version': sys.version.split()[0]
-            }
+            with open('/etc/os-release', 'r') as f:
+                distro = 'Unknown'
+                for line in f:
+                    if line.startswith('PRETTY_NAME='):
+                        distro = line.split('=', 1)[1].strip().strip('"')
+                        break
+        except OSError:
+            pass
+        if distro is None:
+            distro = platform.platform()
+            
+        # Get CPU info, the first processor block is enough for the model name
+        cpu_model = None
+        try:
+            with open('/proc/cpuinfo', 'r') as f:
+                cpu_info = f.read(CPUINFO_READ_SIZE)
+            cpu_model = 'Unknown'
+            for line in cpu_info.split('\n'):
+                if line.startswith('model name'):
+                    cpu_model = line.split(':', 1)[1].strip()
+                    break
+        except OSError:
+            pass
+        if cpu_model is None:
+            cpu_model = platform.processor() or 'Unknown'
+            
+        return {
+            'hostname': uname.nodename,
+            'distro': distro,
+            'kernel': uname.release,
+            'cpu': cpu_model,
+            'platform': 'Linux',
+            'python_version': python_version_label()
+        }
         
     def print_startup_banner(self):
         """Print Linux startup banner"""
@@ -236,19 +342,12 @@ class TrisonicaDataLoggerLinux:
         for port in ports:
             try:
                 self.console.print(f"[TEST] Testing {port}...", end="")
-                ser = serial.Serial(port, self.config.baud_rate, timeout=2)
+                ser = serial.Serial(port, self.config.baud_rate, timeout=DETECT_TIMEOUT)
+                
+                # One bulk read is enough to see Trisonica parameter tags
+                data = ser.read(DETECT_READ_SIZE)
+                trisonica_detected = any(token in data for token in DETECT_TOKENS)
                 
-                # Read several lines to detect Trisonica
-                trisonica_detected = False
-                for _ in range(12):
-                    try:
-                        line = ser.readline().decode('ascii', errors='ignore').strip()
-                        if line and any(param in line for param in ['S1', 'S2', 'S3', 'T1', 'T2']):
-                            trisonica_detected = True
-                            break
-                    except:
-                        continue
-                        
                 ser.close()
                 
                 if trisonica_detected:
@@ -275,7 +374,8 @@ class TrisonicaDataLoggerLinux:
         # Data log
         self.log_filename = f"TrisonicaData_{timestamp}.csv"
         self.log_path = os.path.join(self.config.log_dir, self.log_filename)
-        self.log_file = open(self.log_path, 'w', newline='', encoding='utf-8')
+        self.log_file = open(self.log_path, 'w', newline='', encoding='utf-8', buffering=LOG_BUFFER_SIZE)
+        self.csv_writer = csv.writer(self.log_file, lineterminator='\n')
         
         # Statistics log
         if self.config.save_statistics:
@@ -319,28 +419,16 @@ class TrisonicaDataLoggerLinux:
             self.console.print(f"[ERROR] Connection failed: {e}", style="bold red")
             return False
             
-    def parse_data_line(self, line: str) -> Dict[str, str]:
-        """Enhanced parsing with better error handling"""
-        parsed = {}
+    def parse_data_line(self, line: str, parsed: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Extract key/value pairs in a single regex pass, optionally reusing a dict"""
+        if parsed is None:
+            parsed = {}
+        else:
+            parsed.clear()
         try:
-            if ',' in line:
-                pairs = line.strip().split(',')
-                for pair in pairs:
-                    pair = pair.strip()
-                    if ' ' in pair:
-                        parts = pair.split(' ', 1)
-                        if len(parts) == 2:
-                            key, value = parts
-                            parsed[key.strip()] = value.strip()
-            else:
-                parts = line.strip().split()
-                for i in range(0, len(parts)-1, 2):
-                    if i+1 < len(parts):
-                        parsed[parts[i]] = parts[i+1]
-                        
+            parsed.update(PAIR_PATTERN.findall(line))
         except Exception as e:
             pass
-            
         return parsed
     
     def update_csv_columns(self, parsed_data: Dict[str, str]):
@@ -352,88 +440,183 @@ class TrisonicaDataLoggerLinux:
                 new_columns = True
         
         if not self.csv_headers_written:
-            self.log_file.write(','.join(self.csv_columns) + '\n')
+            self.csv_writer.writerow(self.csv_columns)
             self.csv_headers_written = True
             
-    def write_csv_row(self, timestamp: datetime.datetime, parsed_data: Dict[str, str]):
-        """Write a properly formatted CSV row"""
-        row_values = []
-        for column in self.csv_columns:
-            if column == 'timestamp':
-                row_values.append(timestamp.isoformat())
-            else:
-                value = parsed_data.get(column, '')
-                row_values.append(value)
+    def format_timestamp(self, timestamp_ns: int) -> str:
+        """Local ISO 8601 timestamp with microseconds, reusing the prefix within a second"""
+        seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+        if seconds != self._ts_second:
+            self._ts_second = seconds
+            self._ts_prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+        return f"{self._ts_prefix}.{nanoseconds // 1000:06d}"
         
-        self.log_file.write(','.join(row_values) + '\n')
-        self.log_file.flush()
+    def write_csv_row(self, timestamp_ns: int, parsed_data: Dict[str, str]):
+        """Write a properly formatted CSV row"""
+        row_values = [self.format_timestamp(timestamp_ns)]
+        row_values.extend([parsed_data.get(column, '') for column in self.csv_columns[1:]])
+        self.csv_writer.writerow(row_values)
         
     def calculate_statistics(self, key: str, value: float):
-        """Enhanced statistics with standard deviation"""
+        """Running statistics using Welford's online algorithm"""
         if key not in self.stats:
             self.stats[key] = Statistics()
             
         stat = self.stats[key]
         stat.current_val = value
         stat.count += 1
-        stat.values.append(value)
+        self._stats_dirty = True
         
         if stat.count == 1:
             stat.min_val = stat.max_val = stat.mean_val = value
+            stat.m2 = 0.0
             stat.std_dev = 0.0
         else:
-            stat.min_val = min(stat.min_val, value)
-            stat.max_val = max(stat.max_val, value)
-            
-            stat.mean_val = sum(stat.values) / len(stat.values)
-            
-            if len(stat.values) > 1:
-                variance = sum((x - stat.mean_val) ** 2 for x in stat.values) / len(stat.values)
-                stat.std_dev = variance ** 0.5
+            if value < stat.min_val:
+                stat.min_val = value
+            elif value > stat.max_val:
+                stat.max_val = value
+            
+            delta = value - stat.mean_val
+            stat.mean_val += delta / stat.count
+            stat.m2 += delta * (value - stat.mean_val)
+            stat.std_dev = (stat.m2 / stat.count) ** 0.5
                 
-    def read_serial_data(self) -> Optional[DataPoint]:
-        """Enhanced data reading with performance metrics"""
-        if not self.serial_port or not self.serial_port.is_open:
-            return None
+    def split_lines(self, chunk: bytes) -> List[str]:
+        """Split a received chunk into complete lines, keeping any partial tail"""
+        lines = (self._rx_residual + chunk).split(b'\n')
+        self._rx_residual = lines.pop()
+        
+        decoded = []
+        for raw in lines:
+            line = raw.decode('ascii', errors='ignore').strip()
+            if line:
+                decoded.append(line)
+        return decoded
+        
+    def pin_reader(self):
+        """Pin the calling serial reader thread to one CPU and raise its priority"""
+        if self.config.pin_core is None:
+            return
+            
+        # On Linux both calls apply to the calling thread only
+        try:
+            os.sched_setaffinity(0, {self.config.pin_core})
+        except (AttributeError, OSError) as e:
+            self.console.print(f"[WARNING] Could not pin reader to CPU {self.config.pin_core}: {e}", style="yellow")
             
         try:
-            line = self.serial_port.readline().decode('ascii', errors='ignore').strip()
-            if not line:
-                return None
+            os.nice(READER_NICE_DELTA)
+        except PermissionError:
+            pass
+            
+    def _reader_loop(self):
+        """Background serial reader, keeps the UART drained independently of rendering"""
+        self.pin_reader()
+        while self.running:
+            try:
+                # Copy everything the driver has buffered in one call
+                waiting = self.serial_port.in_waiting
+                chunk = self.serial_port.read(max(waiting, 1))
+            except Exception:
+                if self.running:
+                    time.sleep(UPDATE_INTERVAL)
+                continue
+                
+            if not chunk:
+                continue
                 
-            timestamp = datetime.datetime.now()
-            parsed = self.parse_data_line(line)
+            timestamp_ns = time.time_ns()
+            for line in self.split_lines(chunk):
+                self._rx_queue.put((timestamp_ns, line))
+                
+    def start_reader(self):
+        """Start the background serial reader thread"""
+        self._reader_thread = threading.Thread(target=self._reader_loop, name="serial-reader", daemon=True)
+        self._reader_thread.start()
+        
+    def process_line(self, timestamp_ns: int, line: str) -> Optional[DataPoint]:
+        """Parse, log and accumulate statistics for one received line"""
+        try:
+            # Overwrite the next ring slot rather than allocating a new point
+            data_point = self.data_points.claim()
+            data_point.timestamp_ns = timestamp_ns
+            data_point.raw_data = line
+            parsed = self.parse_data_line(line, data_point.parsed_data)
             
             self.update_csv_columns(parsed)
-            self.write_csv_row(timestamp, parsed)
-            
+            self.write_csv_row(timestamp_ns, parsed)
+            
+            # Hot loop: bind lookups to locals once per line
+            calculate_statistics = self.calculate_statistics
+            viz_series = self.VIZ_MAP.get
+            viz_data = self.viz_data
+            values = data_point.parsed_values
+            values.clear()
             for key, value_str in parsed.items():
                 try:
                     value = float(value_str)
-                    self.calculate_statistics(key, value)
+                    values[key] = value
+                    calculate_statistics(key, value)
                     
-                    if key in ['S', 'S2']:
-                        self.viz_data['wind_speed'].append(value)
-                    elif key == 'T':
-                        self.viz_data['temperature'].append(value)
-                    elif key == 'D':
-                        self.viz_data['wind_direction'].append(value)
+                    series = viz_series(key)
+                    if series is not None:
+                        viz_data[series].append(value)
                         
                 except ValueError:
                     pass
                     
-            self.viz_data['timestamps'].append(timestamp)
+            viz_data['timestamps'].append(timestamp_ns)
                     
             now = time.time()
             if now - self.last_update > 0:
                 self.update_rate = 1.0 / (now - self.last_update)
             self.last_update = now
             
-            return DataPoint(timestamp, line, parsed)
+            return data_point
             
         except Exception as e:
             return None
             
+    def ingest_line(self, timestamp_ns: int, line: str) -> bool:
+        """Process one line and record the resulting data point"""
+        data_point = self.process_line(timestamp_ns, line)
+        if not data_point:
+            return False
+            
+        self.point_count += 1
+        self.data_points.commit()
+        self._current_dirty = self._raw_dirty = True
+        
+        if self.point_count % LOG_FLUSH_INTERVAL == 0:
+            self.log_file.flush()
+            
+        # Save statistics periodically
+        if self.point_count % 200 == 0:
+            self.save_final_statistics()
+            
+        return True
+        
+    def handle_chunk(self, chunk: bytes):
+        """Process a raw chunk delivered by the asyncio transport"""
+        timestamp_ns = time.time_ns()
+        for line in self.split_lines(chunk):
+            self.ingest_line(timestamp_ns, line)
+            
+    def drain_rx_queue(self, timeout: float) -> int:
+        """Process every queued line, waiting up to timeout for the first one"""
+        processed = 0
+        try:
+            item = self._rx_queue.get(timeout=timeout)
+            while True:
+                if self.ingest_line(*item):
+                    processed += 1
+                item = self._rx_queue.get_nowait()
+        except queue.Empty:
+            pass
+            
+        return processed
+        
     def save_final_statistics(self):
         """Save final statistics summary"""
         if not self.config.save_statistics or not self.stats_file:
@@ -445,8 +628,10 @@ class TrisonicaDataLoggerLinux:
                                 f"{stat.mean_val:.6f},{stat.std_dev:.6f},{stat.count}\n")
         self.stats_file.flush()
     
-    def create_layout(self) -> Layout:
+    def create_layout(self) -> 'Layout':
         """Create enhanced Linux layout"""
+        from rich.layout import Layout
+        
         layout = Layout()
         layout.split_column(
             Layout(name="header", size=5),
@@ -465,10 +650,50 @@ class TrisonicaDataLoggerLinux:
             Layout(name="statistics", ratio=1),
             Layout(name="system_info", size=12)
         )
+        
+        # Static panels are drawn once
+        layout["system_info"].update(self.create_system_panel())
+        layout["footer"].update(self.create_footer_panel())
         return layout
         
-    def update_display(self, layout: Layout):
+    def create_system_panel(self) -> 'Panel':
+        """Build the system info panel, its contents never change"""
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich import box
+        
+        system_table = Table(title="System Info", box=box.SIMPLE)
+        system_table.add_column("Property", style="cyan")
+        system_table.add_column("Value", style="white")
+        
+        system_table.add_row("Hostname", self.system_info['hostname'])
+        system_table.add_row("Distribution", self.system_info['distro'][:30])
+        system_table.add_row("Kernel", self.system_info['kernel'])
+        system_table.add_row("CPU", self.system_info['cpu'][:30])
+        system_table.add_row("Python", self.system_info['python_version'])
+        
+        return Panel(system_table, title="Linux System")
+        
+    def create_footer_panel(self) -> 'Panel':
+        """Build the footer panel listing the active log files"""
+        from rich.panel import Panel
+        from rich.align import Align
+        
+        footer_info = []
+        footer_info.append(f"Data: {self.log_filename}")
+        if self.config.save_statistics:
+            footer_info.append(f"Stats: {self.stats_filename}")
+        footer_info.append("Ctrl+C: exit | SIGUSR1: stats")
+        
+        footer_text = " | ".join(footer_info)
+        return Panel(Align.center(footer_text), style="dim")
+        
+    def update_display(self, layout: 'Layout'):
         """Enhanced Linux display"""
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich import box
+        
         elapsed = time.time() - self.start_time
         runtime = str(datetime.timedelta(seconds=int(elapsed)))
         
@@ -478,7 +703,9 @@ class TrisonicaDataLoggerLinux:
         header_table.add_column(justify="center", ratio=1)
         header_table.add_column(justify="right", ratio=1)
         
-        memory_usage = f"{sys.getsizeof(self.data_points) / 1024:.1f} KB"
+        if self._frame_count % MEMORY_SAMPLE_FRAMES == 0:
+            self._memory_usage = f"{sys.getsizeof(self.data_points) / 1024:.1f} KB"
+        self._frame_count += 1
         
         header_table.add_row(
             f"TriSonica Linux Logger - {self.system_info['hostname']}",
@@ -487,47 +714,53 @@ class TrisonicaDataLoggerLinux:
         )
         header_table.add_row(
             f"Update Rate: {self.update_rate:.1f} Hz",
-            f"Memory: {memory_usage}",
-            f"Log: {os.path.basename(self.log_path)}"
+            f"Memory: {self._memory_usage}",
+            f"Log: {self.log_filename}"
         )
         
         layout["header"].update(Panel(header_table, title="System Status", style="bold blue"))
         
         # Current data
-        if self.data_points:
-            latest = self.data_points[-1]
-            
-            data_table = Table(title="Current Measurements", box=box.ROUNDED)
-            data_table.add_column("Parameter", style="cyan", width=12)
-            data_table.add_column("Value", style="green", width=12)
-            data_table.add_column("Unit", style="dim", width=10)
-            data_table.add_column("Quality", style="yellow", width=12)
-            
-            for key, value in latest.parsed_data.items():
-                try:
-                    val = float(value)
-                    if key.startswith('S'):
-                        unit = "m/s"
-                        quality = "Good" if 0 <= val <= 50 else "Check Range"
-                    elif key.startswith('T'):
-                        unit = "°C"
-                        quality = "Good" if -40 <= val <= 60 else "Check Range"
+        if self._current_dirty:
+            self._current_dirty = False
+            if self.data_points:
+                latest = self.data_points[-1]
+                
+                data_table = Table(title="Current Measurements", box=box.ROUNDED)
+                data_table.add_column("Parameter", style="cyan", width=12)
+                data_table.add_column("Value", style="green", width=12)
+                data_table.add_column("Unit", style="dim", width=10)
+                data_table.add_column("Quality", style="yellow", width=12)
+                
+                values = latest.parsed_values
+                for key, value in latest.parsed_data.items():
+                    val = values.get(key)
+                    quality_range = self.QUALITY_RANGES.get(key[:1])
+                    if val is None:
+                        unit = ""
+                        quality = "Invalid"
+                    elif quality_range:
+                        unit, low, high = quality_range
+                        quality = "Good" if low <= val <= high else "Check Range"
                     else:
                         unit = ""
                         quality = "Unknown"
-                except:
-                    unit = ""
-                    quality = "Invalid"
+                        
+                    data_table.add_row(key, value, unit, quality)
                     
-                data_table.add_row(key, value, unit, quality)
+                layout["current_data"].update(Panel(data_table, title="Live Data"))
+            else:
+                layout["current_data"].update(Panel("Waiting for data...", title="Live Data"))
                 
-            layout["current_data"].update(Panel(data_table, title="Live Data"))
-            
-            # Raw data
-            if self.config.show_raw_data:
+        # Raw data
+        if self._raw_dirty:
+            self._raw_dirty = False
+            if not self.data_points:
+                layout["raw_data"].update(Panel("No data received yet", title="Raw Data"))
+            elif self.config.show_raw_data:
                 raw_lines = []
-                for dp in list(self.data_points)[-8:]:
-                    timestamp = dp.timestamp.strftime('%H:%M:%S.%f')[:-3]
+                for dp in self.data_points.recent(8):
+                    timestamp = ns_to_datetime(dp.timestamp_ns).strftime('%H:%M:%S.%f')[:-3]
                     raw_lines.append(f"{timestamp}: {dp.raw_data}")
                     
                 raw_text = "\n".join(raw_lines)
@@ -535,81 +768,73 @@ class TrisonicaDataLoggerLinux:
             else:
                 layout["raw_data"].update(Panel("Raw data display disabled\nUse --show-raw to enable", title="Raw Data"))
                 
-        else:
-            layout["current_data"].update(Panel("Waiting for data...", title="Live Data"))
-            layout["raw_data"].update(Panel("No data received yet", title="Raw Data"))
-            
         # Statistics
-        if self.stats:
-            stats_table = Table(title="Statistical Analysis", box=box.ROUNDED)
-            stats_table.add_column("Parameter", style="cyan")
-            stats_table.add_column("Current", style="green")
-            stats_table.add_column("Min", style="blue")
-            stats_table.add_column("Max", style="red")
-            stats_table.add_column("Mean", style="yellow")
-            stats_table.add_column("Std Dev", style="magenta")
-            stats_table.add_column("Count", style="white")
-            
-            for key, stat in self.stats.items():
-                stats_table.add_row(
-                    key,
-                    f"{stat.current_val:.3f}",
-                    f"{stat.min_val:.3f}",
-                    f"{stat.max_val:.3f}",
-                    f"{stat.mean_val:.3f}",
-                    f"{stat.std_dev:.3f}",
-                    f"{stat.count:,}"
-                )
+        if self._stats_dirty:
+            self._stats_dirty = False
+            if self.stats:
+                stats_table = Table(title="Statistical Analysis", box=box.ROUNDED)
+                stats_table.add_column("Parameter", style="cyan")
+                stats_table.add_column("Current", style="green")
+                stats_table.add_column("Min", style="blue")
+                stats_table.add_column("Max", style="red")
+                stats_table.add_column("Mean", style="yellow")
+                stats_table.add_column("Std Dev", style="magenta")
+                stats_table.add_column("Count", style="white")
                 
-            layout["statistics"].update(Panel(stats_table, title="Statistics"))
-        else:
-            layout["statistics"].update(Panel("No statistics available", title="Statistics"))
-            
-        # System info
-        system_table = Table(title="System Info", box=box.SIMPLE)
-        system_table.add_column("Property", style="cyan")
-        system_table.add_column("Value", style="white")
-        
-        system_table.add_row("Hostname", self.system_info['hostname'])
-        system_table.add_row("Distribution", self.system_info['distro'][:30])
-        system_table.add_row("Kernel", self.system_info['kernel'])
-        system_table.add_row("CPU", self.system_info['cpu'][:30])
-        system_table.add_row("Python", self.system_info['python_version'])
-        
-        layout["system_info"].update(Panel(system_table, title="Linux System"))
+                for key, stat in self.stats.items():
+                    stats_table.add_row(
+                        key,
+                        f"{stat.current_val:.3f}",
+                        f"{stat.min_val:.3f}",
+                        f"{stat.max_val:.3f}",
+                        f"{stat.mean_val:.3f}",
+                        f"{stat.std_dev:.3f}",
+                        f"{stat.count:,}"
+                    )
+                    
+                layout["statistics"].update(Panel(stats_table, title="Statistics"))
+            else:
+                layout["statistics"].update(Panel("No statistics available", title="Statistics"))
+                
+    async def run_async(self, layout: 'Layout', live: 'Live'):
+        """Event-driven main loop: the transport wakes on serial readiness, display ticks on a timer"""
+        self.pin_reader()
+        loop = asyncio.get_running_loop()
+        transport, _ = await serial_asyncio.connection_for_serial(
+            loop, lambda: SerialLineProtocol(self), self.serial_port)
+        try:
+            while self.running:
+                self.update_display(layout)
+                live.refresh()
+                await asyncio.sleep(UPDATE_INTERVAL)
+        finally:
+            transport.close()
             
-        # Footer
-        footer_info = []
-        footer_info.append(f"Data: {self.log_filename}")
-        if self.config.save_statistics:
-            footer_info.append(f"Stats: {self.stats_filename}")
-        footer_info.append("Ctrl+C: exit | SIGUSR1: stats")
-        
-        footer_text = " | ".join(footer_info)
-        layout["footer"].update(Panel(Align.center(footer_text), style="dim"))
-        
     def run(self):
         """Main execution with Linux-optimized interface"""
         if not self.connect_serial():
             return False
             
+        from rich.live import Live
+        
         layout = self.create_layout()
         
         try:
-            with Live(layout, refresh_per_second=25, screen=True) as live:
+            with Live(layout, refresh_per_second=4, auto_refresh=False, screen=True) as live:
                 self.running = True
-                while self.running:
-                    data_point = self.read_serial_data()
-                    if data_point:
-                        self.point_count += 1
-                        self.data_points.append(data_point)
-                        
-                        # Save statistics periodically
-                        if self.point_count % 200 == 0:
-                            self.save_final_statistics()
-                            
-                    self.update_display(layout)
-                    time.sleep(UPDATE_INTERVAL)
+                if serial_asyncio is not None:
+                    asyncio.run(self.run_async(layout, live))
+                else:
+                    self.start_reader()
+                    next_frame = time.monotonic()
+                    while self.running:
+                        # Keep draining serial data until the next frame is due
+                        self.drain_rx_queue(max(0.0, next_frame - time.monotonic()))
+                        now = time.monotonic()
+                        if now >= next_frame:
+                            self.update_display(layout)
+                            live.refresh()
+                            next_frame = now + UPDATE_INTERVAL
                     
         except KeyboardInterrupt:
             pass
@@ -620,6 +845,10 @@ class TrisonicaDataLoggerLinux:
         
     def cleanup(self):
         """Enhanced Linux cleanup"""
+        self.running = False
+        if self._reader_thread and self._reader_thread.is_alive():
+            self._reader_thread.join(timeout=2)
+            
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
             self.console.print("[CLEANUP] Serial port closed", style="green")
@@ -656,6 +885,8 @@ def main():
     parser.add_argument('--no-stats', action='store_true', help='Disable statistics logging')
     parser.add_argument('--no-notifications', action='store_true', help='Disable desktop notifications')
     parser.add_argument('--daemon', action='store_true', help='Run as daemon (background service)')
+    parser.add_argument('--pin-core', type=int, nargs='?', const=0, default=None, metavar='CPU',
+                        help='Pin the serial reader to one CPU core (default core: 0)')
     
     args = parser.parse_args()
     
@@ -665,7 +896,8 @@ def main():
         log_dir=args.log_dir,
         show_raw_data=args.show_raw,
         save_statistics=not args.no_stats,
-        enable_notifications=not args.no_notifications
+        enable_notifications=not args.no_notifications,
+        pin_core=args.pin_core
     )
     
     logger = TrisonicaDataLoggerLinux(config)
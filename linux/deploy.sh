@@ -186,6 +186,7 @@ install_dependencies() {
     
     # Linux-specific packages
     pip install --quiet python-daemon || print_warning "Daemon package failed to install"
+    pip install --quiet pyserial-asyncio || print_warning "pyserial-asyncio failed to install, using threaded serial reader"
     
     print_status "Dependencies installed"
 }
@@ -9,11 +9,15 @@ import re
 import os
 import glob
 import argparse
+import threading
+import selectors
 from collections import deque
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+
 # macOS optimized imports
 from rich.console import Console
 from rich.live import Live
@@ -26,14 +30,30 @@ from rich.align import Align
 from rich import box
 from rich.columns import Columns
 from rich.tree import Tree
-from rich.sparkline import Sparkline
 from rich.bar import Bar
 
 # --- Configuration ---
 DEFAULT_BAUD_RATE = 115200
-MAX_DATAPOINTS = 1000  # More data points on Mac
-UPDATE_INTERVAL = 0.05  # Faster updates on Mac
+RAW_HISTORY = 5  # Raw lines kept for the raw data panel
+UPDATE_INTERVAL = 0.1  # Minimum time between display rebuilds (10 Hz)
+IDLE_UPDATE_INTERVAL = 1.0  # Rebuild at least this often so the runtime keeps ticking
 LOG_ROTATION_SIZE = 50 * 1024 * 1024  # 50MB logs on Mac
+VIZ_HISTORY = 50  # Samples kept per visualization series
+SPARKLINE_WIDTH = 30  # Most recent samples drawn in a sparkline
+SPARKLINE_BLOCKS = np.array(list("▁▂▃▄▅▆▇█"))  # Indexed by sparkline level
+TREND_LEVELS = 8  # Height of a trend bar in characters
+TREND_BARS = tuple("█" * k + "░" * (TREND_LEVELS - k) for k in range(TREND_LEVELS + 1))  # Indexed by bar height
+
+# "KEY value" pairs with numeric values, works for comma and space separated frames
+PAIR_PATTERN = re.compile(r'([A-Za-z]\w*)\s+(-?\d+(?:\.\d+)?)')
+LOG_FLUSH_INTERVAL = 500  # Flush the data log every N points
+WRITE_BATCH_SIZE = 64 * 1024  # Rows are batched in memory up to this many bytes
+WRITE_BATCH_ROWS = 1024  # ...or this many rows, the usual IOV_MAX for one writev call
+READ_SIZE = 4096  # Bytes requested per os.read on the port's file descriptor
+READ_WAIT = 0.1  # Seconds the reader waits for the port before rechecking for shutdown
+ROW_CODEGEN_SAMPLES = 10  # Samples without new columns before the row writer is specialized
+STATS_SNAPSHOT_INTERVAL = 10.0  # Seconds between statistics snapshots
+STATS_BATCH_SIZE = 16 * 1024  # Statistics snapshots are batched up to this many bytes
 
 @dataclass
 class Config:
@@ -47,9 +67,10 @@ class Config:
 
 @dataclass
 class DataPoint:
-    timestamp: datetime.datetime
+    timestamp_ns: int  # time.time_ns() at arrival
     raw_data: str
     parsed_data: Dict[str, str] = field(default_factory=dict)
+    parsed_floats: Dict[str, float] = field(default_factory=dict)  # Converted once at ingest
 
 @dataclass
 class Statistics:
@@ -59,37 +80,87 @@ class Statistics:
     current_val: float = 0.0
     std_dev: float = 0.0
     count: int = 0
-    values: deque = field(default_factory=lambda: deque(maxlen=100))
+    m2: float = 0.0  # Running sum of squared deviations (Welford)
+
+class RingBuffer:
+    """Fixed-size NumPy ring buffer for a visualization series"""
+    def __init__(self, size: int, dtype=np.float32):
+        self.data = np.zeros(size, dtype=dtype)
+        self.size = size
+        self.head = 0   # Next write position
+        self.count = 0  # Total values appended
+        
+    def __len__(self) -> int:
+        return min(self.count, self.size)
+        
+    def append(self, value: float):
+        self.data[self.head] = value
+        self.head = (self.head + 1) % self.size
+        self.count += 1
+        
+    def last(self) -> float:
+        return float(self.data[self.head - 1])
+        
+    def values(self) -> np.ndarray:
+        """Stored values in arrival order, oldest first"""
+        if self.count < self.size:
+            return self.data[:self.count]
+        return np.concatenate((self.data[self.head:], self.data[:self.head]))
 
 class TrisonicaDataLoggerMac:
+    # Parameter key -> visualization series it feeds
+    VIZ_MAP = {
+        'S': 'wind_speed',       # Wind speed
+        'S2': 'wind_speed',
+        'T': 'temperature',      # Temperature
+        'D': 'wind_direction'    # Wind direction
+    }
+    
     def __init__(self, config: Config):
         self.config = config
         self.serial_port = None
-        self.log_file = None
+        self._log_fd = None
         self.stats_file = None
         self.console = Console()
         self.running = False
         self.start_time = time.time()
         
         # Data storage
-        self.data_points = deque(maxlen=MAX_DATAPOINTS)
+        self._latest_dp = None  # Most recent DataPoint, for the live data panel
+        self._raw_ring = deque(maxlen=RAW_HISTORY)  # (timestamp_ns, raw line) for the raw data panel
         self.point_count = 0
         self.stats = {}
         
         # CSV column management
         self.csv_columns = ['timestamp']  # Start with timestamp
+        self.csv_column_set = {'timestamp'}  # O(1) membership checks per sample
         self.csv_headers_written = False
+        self._fast_row = None  # Row formatter generated for the current column set
+        self._stable_samples = 0  # Samples seen since the column set last changed
         
         # macOS specific
         self.last_update = time.time()
         self.update_rate = 0.0
+        self._rxbuf = bytearray()  # Received bytes not yet terminated by a newline
+        self._rxq = deque()  # Parsed DataPoints handed from the reader thread to the main loop
+        self._rx_event = threading.Event()  # Set by the reader whenever it queues a DataPoint
+        self._reader = None
+        self._fd = None  # Port file descriptor, read directly when pyserial exposes one
+        self._selector = None
+        self._read_error = None  # Error that stopped the reader, reported after the display closes
+        self._ts_second = None  # Second the cached timestamp prefix belongs to
+        self._ts_prefix = ''
+        self._viz_cache = {}  # Panel name -> (cache key, last rendered Panel)
+        self._data_table = None  # Reused across frames; only rows are rebuilt
+        self._stats_table = None
+        self._compass_panels = tuple(self.build_compass_panel(heading) for heading in range(360))
         
         # Visualization data storage
         self.viz_data = {
-            'wind_speed': deque(maxlen=50),      # S or S2 values
-            'temperature': deque(maxlen=50),     # T values
-            'wind_direction': deque(maxlen=50),  # D values
-            'timestamps': deque(maxlen=50)       # For trend analysis
+            'wind_speed': RingBuffer(VIZ_HISTORY),                    # S or S2 values
+            'temperature': RingBuffer(VIZ_HISTORY),                   # T values
+            'wind_direction': RingBuffer(VIZ_HISTORY),                # D values
+            'timestamps': RingBuffer(VIZ_HISTORY, dtype=np.float64)   # POSIX seconds, for trend analysis
         }
         
         # Ensure log directory exists
@@ -118,7 +189,7 @@ class TrisonicaDataLoggerMac:
         self.console.print(f"Platform: macOS")
         self.console.print(f"Python: {sys.version.split()[0]}")
         self.console.print(f"Log Directory: {self.config.log_dir}")
-        self.console.print(f"Max Data Points: {MAX_DATAPOINTS:,}")
+        self.console.print(f"Visualization History: {VIZ_HISTORY:,} samples")
         self.console.print("─" * 60)
         
     def find_serial_ports(self) -> List[str]:
@@ -186,15 +257,18 @@ class TrisonicaDataLoggerMac:
         # Data log
         self.log_filename = f"TrisonicaData_{timestamp}.csv"
         self.log_path = os.path.join(self.config.log_dir, self.log_filename)
-        self.log_file = open(self.log_path, 'w', newline='')
+        self._log_fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._pending_rows = []  # Encoded rows waiting for the next writev
+        self._pending_bytes = 0
         # Headers will be written dynamically when first data arrives
         
         # Statistics log
         if self.config.save_statistics:
             self.stats_filename = f"TrisonicaStats_{timestamp}.csv"
             self.stats_path = os.path.join(self.config.log_dir, self.stats_filename)
-            self.stats_file = open(self.stats_path, 'w', newline='')
-            self.stats_file.write("timestamp,parameter,min,max,mean,std_dev,count\n")
+            self.stats_file = open(self.stats_path, 'wb')
+            self.stats_file.write(b"timestamp,parameter,min,max,mean,std_dev,count\n")
+            self._statsbuf = bytearray()
             
         self.console.print(f"[LOG] Data Log: {self.log_filename}")
         if self.config.save_statistics:
@@ -203,7 +277,7 @@ class TrisonicaDataLoggerMac:
     def signal_handler(self, signum, frame):
         """Enhanced signal handler"""
         self.console.print(f"\n[SHUTDOWN] Received signal {signum}, saving data and shutting down...", style="bold yellow")
-        self.save_final_statistics()
+        # run() saves the final statistics once the main loop has stopped
         self.running = False
         
     def connect_serial(self) -> bool:
@@ -217,6 +291,17 @@ class TrisonicaDataLoggerMac:
             
         try:
             self.serial_port = serial.Serial(port, self.config.baud_rate, timeout=1)
+            
+            # pyserial already opens the port non-blocking in raw mode, so the
+            # descriptor can be read directly once select reports it readable
+            try:
+                self._fd = self.serial_port.fileno()
+                self._selector = selectors.DefaultSelector()
+                self._selector.register(self._fd, selectors.EVENT_READ)
+            except Exception:
+                self._fd = None
+                self._selector = None
+                
             self.console.print(f"[SUCCESS] Connected to {port} at {self.config.baud_rate:,} baud", style="bold green")
             return True
         except serial.SerialException as e:
@@ -224,222 +309,377 @@ class TrisonicaDataLoggerMac:
             return False
             
     def parse_data_line(self, line: str) -> Dict[str, str]:
-        """Enhanced parsing with better error handling"""
-        parsed = {}
+        """Extract key/value pairs with a single regex scan"""
         try:
-            # Handle multiple possible formats
-            if ',' in line:
-                pairs = line.strip().split(',')
-                for pair in pairs:
-                    pair = pair.strip()
-                    if ' ' in pair:
-                        parts = pair.split(' ', 1)
-                        if len(parts) == 2:
-                            key, value = parts
-                            parsed[key.strip()] = value.strip()
-            else:
-                # Space-separated format
-                parts = line.strip().split()
-                for i in range(0, len(parts)-1, 2):
-                    if i+1 < len(parts):
-                        parsed[parts[i]] = parts[i+1]
-                        
+            return dict(PAIR_PATTERN.findall(line))
         except Exception as e:
             # Log parsing errors but continue
-            pass
-            
-        return parsed
+            return {}
     
     def update_csv_columns(self, parsed_data: Dict[str, str]):
         """Update CSV columns based on new parameters found"""
-        new_columns = False
-        for key in parsed_data.keys():
-            if key not in self.csv_columns:
+        new_columns = []
+        for key in parsed_data:
+            if key not in self.csv_column_set:
+                self.csv_column_set.add(key)
                 self.csv_columns.append(key)
-                new_columns = True
+                new_columns.append(key)
+                
+        # Specialize the row writer once the column set has stopped changing
+        if new_columns:
+            self._fast_row = None
+            self._stable_samples = 0
+        elif self._fast_row is None:
+            self._stable_samples += 1
+            if self._stable_samples >= ROW_CODEGEN_SAMPLES:
+                self._fast_row = self.build_row_formatter()
+                
+        # The header is written once, later parameters are appended to rows only
+        if new_columns and self.csv_headers_written:
+            self.console.print(f"[WARNING] New parameter(s) after CSV header was written: {', '.join(new_columns)}",
+                               style="yellow")
         
-        # Write headers if this is the first data or if new columns were added
+        # Write headers if this is the first data
         if not self.csv_headers_written:
-            self.log_file.write(','.join(self.csv_columns) + '\n')
+            header = (','.join(self.csv_columns) + '\n').encode('ascii')
+            self._pending_rows.append(header)
+            self._pending_bytes += len(header)
             self.csv_headers_written = True
             
-    def write_csv_row(self, timestamp: datetime.datetime, parsed_data: Dict[str, str]):
-        """Write a properly formatted CSV row"""
-        row_values = []
-        for column in self.csv_columns:
-            if column == 'timestamp':
-                row_values.append(timestamp.isoformat())
-            else:
-                # Get value for this column, or empty string if not present
-                value = parsed_data.get(column, '')
-                row_values.append(value)
+    def format_timestamp(self, timestamp_ns: int) -> str:
+        """Local ISO 8601 timestamp with microseconds, reusing the prefix within a second"""
+        seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+        if seconds != self._ts_second:
+            self._ts_second = seconds
+            self._ts_prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+        return f"{self._ts_prefix}.{nanoseconds // 1000:06d}"
+        
+    def build_row_formatter(self):
+        """Generate a row formatter with the current columns unrolled into one expression"""
+        fields = ''.join(f" + ',' + get({column!r}, '')" for column in self.csv_columns[1:])
+        source = (
+            "def _fast_row(parsed_data, timestamp):\n"
+            "    get = parsed_data.get\n"
+            f"    return timestamp{fields} + '\\n'\n"
+        )
+        namespace = {}
+        exec(source, namespace)
+        return namespace['_fast_row']
         
-        self.log_file.write(','.join(row_values) + '\n')
-        self.log_file.flush()
+    def write_csv_row(self, timestamp_ns: int, parsed_data: Dict[str, str]):
+        """Write a properly formatted CSV row"""
+        # Timestamp is always the first column, missing parameters are left empty
+        if self._fast_row is not None:
+            row = self._fast_row(parsed_data, self.format_timestamp(timestamp_ns)).encode('ascii')
+        else:
+            get = parsed_data.get
+            row = (','.join([self.format_timestamp(timestamp_ns)] + [get(column, '') for column in self.csv_columns[1:]])
+                   + '\n').encode('ascii')
+        self._pending_rows.append(row)
+        self._pending_bytes += len(row)
+        if self._pending_bytes >= WRITE_BATCH_SIZE or len(self._pending_rows) >= WRITE_BATCH_ROWS:
+            self.flush_log()
+            
+    def flush_log(self):
+        """Write all batched rows to the data log with a single writev"""
+        if not self._pending_rows:
+            return
+            
+        written = os.writev(self._log_fd, self._pending_rows)
+        if written < self._pending_bytes:
+            # Short write, finish the remainder with plain writes
+            remaining = memoryview(b''.join(self._pending_rows))[written:]
+            while remaining:
+                remaining = remaining[os.write(self._log_fd, remaining):]
+        self._pending_rows.clear()
+        self._pending_bytes = 0
         
     def calculate_statistics(self, key: str, value: float):
-        """Enhanced statistics with standard deviation"""
+        """Running statistics using Welford's online algorithm"""
         if key not in self.stats:
             self.stats[key] = Statistics()
             
         stat = self.stats[key]
         stat.current_val = value
         stat.count += 1
-        stat.values.append(value)
         
         if stat.count == 1:
             stat.min_val = stat.max_val = stat.mean_val = value
+            stat.m2 = 0.0
             stat.std_dev = 0.0
         else:
-            stat.min_val = min(stat.min_val, value)
-            stat.max_val = max(stat.max_val, value)
-            
-            # Calculate mean
-            stat.mean_val = sum(stat.values) / len(stat.values)
-            
-            # Calculate standard deviation
-            if len(stat.values) > 1:
-                variance = sum((x - stat.mean_val) ** 2 for x in stat.values) / len(stat.values)
-                stat.std_dev = variance ** 0.5
+            if value < stat.min_val:
+                stat.min_val = value
+            elif value > stat.max_val:
+                stat.max_val = value
                 
-    def read_serial_data(self) -> Optional[DataPoint]:
-        """Enhanced data reading with performance metrics"""
+            # Update running mean and sum of squared deviations
+            delta = value - stat.mean_val
+            stat.mean_val += delta / stat.count
+            stat.m2 += delta * (value - stat.mean_val)
+            stat.std_dev = (stat.m2 / stat.count) ** 0.5
+                
+    def fill_rx_buffer(self) -> bool:
+        """Append everything buffered on the port to _rxbuf, False if the port could not be read"""
         if not self.serial_port or not self.serial_port.is_open:
-            return None
+            return False
             
         try:
-            line = self.serial_port.readline().decode('ascii', errors='ignore').strip()
-            if not line:
-                return None
+            if self._selector is not None:
+                # One syscall for everything buffered by the driver
+                if not self._selector.select(READ_WAIT):
+                    return True
+                chunk = os.read(self._fd, READ_SIZE)
+                if not chunk:
+                    # Readable but empty means the device went away (e.g. USB adapter unplugged)
+                    raise serial.SerialException("device reports readiness to read but returned no data "
+                                                 "(device disconnected?)")
+                self._rxbuf += chunk
+            else:
+                # One read for all waiting bytes, blocks up to the port timeout when idle
+                waiting = self.serial_port.in_waiting
+                self._rxbuf += self.serial_port.read(waiting or 1)
+        except OSError as e:
+            # SerialException is an OSError too; the port is unusable, so stop logging
+            self._read_error = e
+            self.running = False
+            self._rx_event.set()
+            return False
+        except Exception as e:
+            self.console.print(f"[ERROR] Serial read failed: {e}", style="bold red")
+            return False
+        return True
+        
+    def parse_rx_buffer(self) -> Iterator[DataPoint]:
+        """Yield a DataPoint per complete line in _rxbuf, keeping any partial line"""
+        while True:
+            end = self._rxbuf.find(b'\n')
+            if end < 0:
+                break
+            line = self._rxbuf[:end].decode('ascii', errors='ignore').strip()
+            del self._rxbuf[:end + 1]
+            if line:
+                data_point = self.process_line(line)
+                if data_point:
+                    yield data_point
+                    
+    def _reader_loop(self):
+        """Background thread: read and parse serial data, queueing DataPoints for the main loop"""
+        # pyserial releases the GIL while blocked in read, so rendering keeps running
+        while self.running:
+            if not self.fill_rx_buffer():
+                # Port closed or read failed, back off instead of spinning on it
+                if self.running:
+                    time.sleep(UPDATE_INTERVAL)
+                continue
                 
-            timestamp = datetime.datetime.now()
-            parsed = self.parse_data_line(line)
+            for data_point in self.parse_rx_buffer():
+                self._rxq.append(data_point)
+                self._rx_event.set()
+                
+    def start_reader(self):
+        """Start the serial reader thread"""
+        self._reader = threading.Thread(target=self._reader_loop, name="serial-reader", daemon=True)
+        self._reader.start()
+        
+    def stop_reader(self):
+        """Stop the serial reader thread, waiting at most one read timeout"""
+        self.running = False
+        if self._reader and self._reader.is_alive():
+            self._reader.join(timeout=2.0)
             
-            # Update CSV columns and write properly formatted row
-            self.update_csv_columns(parsed)
-            self.write_csv_row(timestamp, parsed)
+    def process_line(self, line: str) -> Optional[DataPoint]:
+        """Timestamp and parse one received line"""
+        try:
+            timestamp_ns = time.time_ns()
+            parsed = self.parse_data_line(line)
             
-            # Update statistics
+            parsed_floats = {}
             for key, value_str in parsed.items():
                 try:
-                    value = float(value_str)
-                    self.calculate_statistics(key, value)
-                    
-                    # Update visualization data
-                    if key in ['S', 'S2']:  # Wind speed
-                        self.viz_data['wind_speed'].append(value)
-                    elif key == 'T':  # Temperature
-                        self.viz_data['temperature'].append(value)
-                    elif key == 'D':  # Wind direction
-                        self.viz_data['wind_direction'].append(value)
-                        
+                    parsed_floats[key] = float(value_str)
                 except ValueError:
                     pass
                     
+            return DataPoint(timestamp_ns, line, parsed, parsed_floats)
+            
+        except Exception as e:
+            return None
+            
+    def record_data_point(self, data_point: DataPoint):
+        """Log and accumulate statistics for one parsed DataPoint"""
+        try:
+            timestamp_ns = data_point.timestamp_ns
+            
+            # Update CSV columns and write properly formatted row
+            self.update_csv_columns(data_point.parsed_data)
+            self.write_csv_row(timestamp_ns, data_point.parsed_data)
+            
+            # Update statistics
+            for key, value in data_point.parsed_floats.items():
+                self.calculate_statistics(key, value)
+                
+                # Update visualization data
+                series = self.VIZ_MAP.get(key)
+                if series is not None:
+                    self.viz_data[series].append(value)
+                    
             # Update timestamps for visualization
-            self.viz_data['timestamps'].append(timestamp)
+            arrival = timestamp_ns / 1e9
+            self.viz_data['timestamps'].append(arrival)
                     
-            # Calculate update rate
-            now = time.time()
-            if now - self.last_update > 0:
-                self.update_rate = 1.0 / (now - self.last_update)
-            self.last_update = now
-            
-            return DataPoint(timestamp, line, parsed)
+            # Calculate update rate from arrival times, points are drained in batches
+            if arrival - self.last_update > 0:
+                self.update_rate = 1.0 / (arrival - self.last_update)
+            self.last_update = arrival
             
         except Exception as e:
-            return None
+            pass
             
-    def save_final_statistics(self):
-        """Save final statistics summary"""
+        self.point_count += 1
+        self._latest_dp = data_point
+        self._raw_ring.append((data_point.timestamp_ns, data_point.raw_data))
+        
+        if self.point_count % LOG_FLUSH_INTERVAL == 0:
+            self.flush_log()
+            
+    def drain_rx_queue(self) -> bool:
+        """Record every DataPoint queued by the reader thread, returns True if any were waiting"""
+        rxq = self._rxq
+        if not rxq:
+            return False
+        while rxq:
+            self.record_data_point(rxq.popleft())
+        return True
+            
+    def _snapshot_stats(self):
+        """Append one line per parameter to the statistics buffer, writing it out once it fills"""
         if not self.config.save_statistics or not self.stats_file:
             return
             
         timestamp = datetime.datetime.now().isoformat()
         for key, stat in self.stats.items():
-            self.stats_file.write(f"{timestamp},{key},{stat.min_val:.6f},{stat.max_val:.6f},"
-                                f"{stat.mean_val:.6f},{stat.std_dev:.6f},{stat.count}\n")
+            self._statsbuf += (f"{timestamp},{key},{stat.min_val:.6f},{stat.max_val:.6f},"
+                               f"{stat.mean_val:.6f},{stat.std_dev:.6f},{stat.count}\n").encode('ascii')
+        if len(self._statsbuf) >= STATS_BATCH_SIZE:
+            self.stats_file.write(self._statsbuf)
+            self._statsbuf.clear()
+            
+    def save_final_statistics(self):
+        """Save final statistics summary"""
+        if not self.config.save_statistics or not self.stats_file or self.stats_file.closed:
+            return
+            
+        self._snapshot_stats()
+        if self._statsbuf:
+            self.stats_file.write(self._statsbuf)
+            self._statsbuf.clear()
         self.stats_file.flush()
     
-    def create_sparkline(self, data: deque, title: str) -> Panel:
+    def get_cached_panel(self, name: str, key) -> Optional[Panel]:
+        """Return the last panel built for name if it was built from the same key"""
+        cached = self._viz_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        return None
+        
+    def store_cached_panel(self, name: str, key, panel: Panel) -> Panel:
+        self._viz_cache[name] = (key, panel)
+        return panel
+    
+    def create_sparkline(self, data: RingBuffer, title: str) -> Panel:
         """Create a sparkline visualization"""
         if len(data) < 2:
             return Panel(f"[dim]Collecting {title} data...[/dim]", title=title)
         
-        try:
-            # Convert to list and ensure we have numeric data
-            values = [float(x) for x in data if x is not None]
-            if not values:
-                return Panel(f"[dim]No {title} data[/dim]", title=title)
+        # The series only changes when a value is appended
+        cache_key = (data.count, data.last())
+        cached = self.get_cached_panel(title, cache_key)
+        if cached is not None:
+            return cached
             
-            # Create sparkline
-            sparkline = Sparkline(values, width=30)
+        try:
+            values = data.values()
+            
+            # Create sparkline straight from the float32 window, one block character per sample
+            window = values[-SPARKLINE_WIDTH:]
+            low, high = window.min(), window.max()
+            top = len(SPARKLINE_BLOCKS) - 1
+            if high == low:
+                levels = np.full(len(window), top // 2, dtype=np.uint8)
+            else:
+                levels = ((window - low) * (top / (high - low))).round().astype(np.uint8)
+            sparkline = ''.join(SPARKLINE_BLOCKS[levels].tolist())
             
             # Add current value and trend
-            current = values[-1]
+            current = float(values[-1])
             trend = "↗" if len(values) > 1 and values[-1] > values[-2] else "↘"
             
             content = f"{sparkline}\n[bold]{title}: {current:.2f}[/bold] {trend}"
-            return Panel(content, title=title, border_style="bright_blue")
+            return self.store_cached_panel(title, cache_key,
+                                           Panel(content, title=title, border_style="bright_blue"))
             
         except Exception as e:
             return Panel(f"[red]Error: {e}[/red]", title=title)
     
-    def create_wind_compass(self, directions: deque) -> Panel:
-        """Create ASCII wind compass"""
-        if len(directions) < 1:
-            return Panel("[dim]No wind direction data[/dim]", title="Wind Direction")
-        
-        try:
-            current_dir = float(directions[-1])
-            
-            # Simple 8-point compass
-            compass_points = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
-            index = int((current_dir + 22.5) / 45) % 8
-            direction = compass_points[index]
-            
-            # Create simple compass visualization
-            compass = f"""
+    def build_compass_panel(self, heading: int) -> Panel:
+        """Render the compass panel for a whole-degree heading"""
+        # Simple 8-point compass
+        compass_points = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
+        direction = compass_points[int((heading + 22.5) / 45) % 8]
+        
+        # Create simple compass visualization
+        compass = f"""
      N
    NW+NE
   W  +  E
    SW+SE
      S
      
-Current: {current_dir:.0f}° ({direction})
+Current: {heading}° ({direction})
 """
-            return Panel(compass, title="Wind Direction", border_style="bright_green")
+        return Panel(compass, title="Wind Direction", border_style="bright_green")
+        
+    def create_wind_compass(self, directions: RingBuffer) -> Panel:
+        """Create ASCII wind compass"""
+        if len(directions) < 1:
+            return Panel("[dim]No wind direction data[/dim]", title="Wind Direction")
+        
+        try:
+            # The panel only shows the heading to the nearest degree
+            return self._compass_panels[round(directions.last()) % 360]
             
         except Exception as e:
             return Panel(f"[red]Error: {e}[/red]", title="Wind Direction")
     
-    def create_trend_bars(self, data: deque, title: str, max_bars: int = 10) -> Panel:
+    def create_trend_bars(self, data: RingBuffer, title: str, max_bars: int = 10) -> Panel:
         """Create trend bars visualization"""
         if len(data) < 2:
             return Panel(f"[dim]Collecting {title} data...[/dim]", title=title)
         
+        cache_key = (data.count, data.last(), max_bars)
+        cached = self.get_cached_panel(f"{title} Trend", cache_key)
+        if cached is not None:
+            return cached
+            
         try:
             # Get last few values
-            values = [float(x) for x in list(data)[-max_bars:] if x is not None]
-            if not values:
-                return Panel(f"[dim]No {title} data[/dim]", title=title)
+            values = data.values()[-max_bars:]
             
-            # Normalize values to 0-1 range
-            min_val, max_val = min(values), max(values)
+            # Normalize the whole window to bar heights in one vectorized pass
+            min_val, max_val = values.min(), values.max()
             if max_val == min_val:
-                normalized = [0.5] * len(values)
+                heights = np.full(len(values), TREND_LEVELS // 2, dtype=np.uint8)
             else:
-                normalized = [(v - min_val) / (max_val - min_val) for v in values]
+                heights = ((values - min_val) * (TREND_LEVELS / (max_val - min_val))).astype(np.uint8)
             
-            # Create vertical bars
-            bars = []
-            for i, norm_val in enumerate(normalized):
-                bar_height = int(norm_val * 8)  # 8 levels
-                bar = "█" * bar_height + "░" * (8 - bar_height)
-                bars.append(f"{values[i]:.1f}\n{bar}")
+            # Create vertical bars for the last 5 values
+            bars = [f"{value:.1f}\n{TREND_BARS[height]}"
+                    for value, height in zip(values[-5:].tolist(), heights[-5:].tolist())]
             
-            content = "\n".join(bars[-5:])  # Show last 5 bars
-            return Panel(content, title=f"{title} Trend", border_style="bright_yellow")
+            content = "\n".join(bars)
+            return self.store_cached_panel(f"{title} Trend", cache_key,
+                                           Panel(content, title=f"{title} Trend", border_style="bright_yellow"))
             
         except Exception as e:
             return Panel(f"[red]Error: {e}[/red]", title=title)
@@ -466,6 +706,13 @@ Current: {current_dir:.0f}° ({direction})
         )
         return layout
         
+    def reset_table(self, table: Table) -> Table:
+        """Drop a table's rows but keep its columns and styles"""
+        table.rows.clear()
+        for column in table.columns:
+            column._cells.clear()
+        return table
+        
     def update_display(self, layout: Layout):
         """Enhanced display with more information"""
         # Header with system info
@@ -478,7 +725,8 @@ Current: {current_dir:.0f}° ({direction})
         header_table.add_column(justify="right", ratio=1)
         
         # System metrics
-        memory_usage = f"{sys.getsizeof(self.data_points) / 1024:.1f} KB"
+        history_bytes = sys.getsizeof(self._raw_ring) + sum(ring.data.nbytes for ring in self.viz_data.values())
+        memory_usage = f"{history_bytes / 1024:.1f} KB"
         
         header_table.add_row(
             "Trisonica macOS Logger",
@@ -494,31 +742,34 @@ Current: {current_dir:.0f}° ({direction})
         layout["header"].update(Panel(header_table, title="System Status", style="bold blue"))
         
         # Current data
-        if self.data_points:
-            latest = self.data_points[-1]
+        if self._latest_dp:
+            latest = self._latest_dp
             
             # Live data table
-            data_table = Table(title="Current Measurements", box=box.ROUNDED)
-            data_table.add_column("Parameter", style="cyan", width=12)
-            data_table.add_column("Value", style="green", width=10)
-            data_table.add_column("Unit", style="dim", width=8)
-            data_table.add_column("Quality", style="yellow", width=10)
+            if self._data_table is None:
+                data_table = Table(title="Current Measurements", box=box.ROUNDED)
+                data_table.add_column("Parameter", style="cyan", width=12)
+                data_table.add_column("Value", style="green", width=10)
+                data_table.add_column("Unit", style="dim", width=8)
+                data_table.add_column("Quality", style="yellow", width=10)
+                self._data_table = data_table
+            else:
+                data_table = self.reset_table(self._data_table)
             
             for key, value in latest.parsed_data.items():
-                try:
-                    val = float(value)
-                    if key.startswith('S'):
-                        unit = "m/s"
-                        quality = "Good" if 0 <= val <= 50 else "Check"
-                    elif key.startswith('T'):
-                        unit = "°C"
-                        quality = "Good" if -40 <= val <= 60 else "Check"
-                    else:
-                        unit = ""
-                        quality = "Unknown"
-                except:
+                val = latest.parsed_floats.get(key)
+                if val is None:
                     unit = ""
                     quality = "Invalid"
+                elif key.startswith('S'):
+                    unit = "m/s"
+                    quality = "Good" if 0 <= val <= 50 else "Check"
+                elif key.startswith('T'):
+                    unit = "°C"
+                    quality = "Good" if -40 <= val <= 60 else "Check"
+                else:
+                    unit = ""
+                    quality = "Unknown"
                     
                 data_table.add_row(key, value, unit, quality)
                 
@@ -527,9 +778,10 @@ Current: {current_dir:.0f}° ({direction})
             # Raw data display
             if self.config.show_raw_data:
                 raw_lines = []
-                for dp in list(self.data_points)[-5:]:
-                    timestamp = dp.timestamp.strftime('%H:%M:%S.%f')[:-3]
-                    raw_lines.append(f"{timestamp}: {dp.raw_data}")
+                for timestamp_ns, raw_data in self._raw_ring:
+                    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+                    timestamp = f"{time.strftime('%H:%M:%S', time.localtime(seconds))}.{nanoseconds // 1_000_000:03d}"
+                    raw_lines.append(f"{timestamp}: {raw_data}")
                     
                 raw_text = "\n".join(raw_lines)
                 layout["raw_data"].update(Panel(raw_text, title="Raw Data Stream"))
@@ -542,14 +794,18 @@ Current: {current_dir:.0f}° ({direction})
             
         # Statistics panel
         if self.stats:
-            stats_table = Table(title="Statistical Analysis", box=box.ROUNDED)
-            stats_table.add_column("Parameter", style="cyan")
-            stats_table.add_column("Current", style="green")
-            stats_table.add_column("Min", style="blue")
-            stats_table.add_column("Max", style="red")
-            stats_table.add_column("Mean", style="yellow")
-            stats_table.add_column("Std Dev", style="magenta")
-            stats_table.add_column("Count", style="white")
+            if self._stats_table is None:
+                stats_table = Table(title="Statistical Analysis", box=box.ROUNDED)
+                stats_table.add_column("Parameter", style="cyan")
+                stats_table.add_column("Current", style="green")
+                stats_table.add_column("Min", style="blue")
+                stats_table.add_column("Max", style="red")
+                stats_table.add_column("Mean", style="yellow")
+                stats_table.add_column("Std Dev", style="magenta")
+                stats_table.add_column("Count", style="white")
+                self._stats_table = stats_table
+            else:
+                stats_table = self.reset_table(self._stats_table)
             
             for key, stat in self.stats.items():
                 stats_table.add_row(
@@ -616,36 +872,61 @@ Current: {current_dir:.0f}° ({direction})
         layout = self.create_layout()
         
         try:
-            with Live(layout, refresh_per_second=20, screen=True) as live:
+            # Refresh only after update_display: the cached tables are refilled in place,
+            # so an auto-refresh thread could render one half-reset
+            with Live(layout, auto_refresh=False, screen=True) as live:
                 self.running = True
+                self.start_reader()
+                last_render = 0.0
+                last_snapshot = time.time()
+                dirty = True
                 while self.running:
-                    data_point = self.read_serial_data()
-                    if data_point:
-                        self.point_count += 1
-                        self.data_points.append(data_point)
+                    # Sleep until the reader queues data, waking at least once per render interval
+                    self._rx_event.wait(UPDATE_INTERVAL)
+                    self._rx_event.clear()
+                    if self.drain_rx_queue():
+                        dirty = True
                         
-                        # Save statistics periodically
-                        if self.point_count % 100 == 0:
-                            self.save_final_statistics()
-                            
-                    self.update_display(layout)
-                    time.sleep(UPDATE_INTERVAL)
+                    # Snapshot statistics periodically, the final summary is written at shutdown
+                    now = time.time()
+                    if now - last_snapshot >= STATS_SNAPSHOT_INTERVAL:
+                        self._snapshot_stats()
+                        last_snapshot = now
+                        
+                    # Only rebuild the display when something changed, at most every UPDATE_INTERVAL
+                    since_render = now - last_render
+                    if (dirty and since_render >= UPDATE_INTERVAL) or since_render >= IDLE_UPDATE_INTERVAL:
+                        self.update_display(layout)
+                        live.refresh()
+                        last_render = now
+                        dirty = False
                     
         except KeyboardInterrupt:
             pass
         finally:
+            self.stop_reader()
+            self.drain_rx_queue()
+            if self._read_error is not None:
+                self.console.print(f"[ERROR] Serial connection lost: {self._read_error}", style="bold red")
+            self.save_final_statistics()
             self.cleanup()
             
         return True
         
     def cleanup(self):
         """Enhanced cleanup"""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+            
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
             self.console.print("[CLEANUP] Serial port closed", style="green")
             
-        if self.log_file and not self.log_file.closed:
-            self.log_file.close()
+        if self._log_fd is not None:
+            self.flush_log()
+            os.close(self._log_fd)
+            self._log_fd = None
             self.console.print(f"[CLEANUP] Data log saved: {self.log_path}", style="green")
             
         if self.stats_file and not self.stats_file.closed:
@@ -104,10 +104,10 @@ install_dependencies() {
     source "$VENV_DIR/bin/activate"
     
     # Install required packages
-    pip install pyserial rich psutil
+    pip install pyserial rich psutil numpy
     
     # Optional packages for advanced features
-    pip install --quiet matplotlib numpy pandas || print_warning "Optional packages failed to install"
+    pip install --quiet matplotlib pandas || print_warning "Optional packages failed to install"
     
     print_status "Dependencies installed"
 }
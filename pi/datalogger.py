@@ -11,18 +11,37 @@ import os
 import sys
 import signal
 import re
+import select
 import argparse
 import glob
-from collections import deque
 from typing import Dict, Optional, List, Tuple, Any
 from dataclasses import dataclass
 from pathlib import Path
 import logging
+import logging.handlers
+import queue
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Performance configuration optimized for Raspberry Pi
 MAX_DATAPOINTS = 100   # Keep last N data points for display (reduced for Pi)
-UPDATE_INTERVAL = 1.0  # Screen update interval (1s = 1 Hz, Pi-friendly)
+SELECT_TIMEOUT = 0.25  # Longest idle wait on the serial port before the loop wakes anyway
 LOG_ROTATION_SIZE = 10 * 1024 * 1024  # 10MB (SD card friendly)
+WRITE_BATCH_SIZE = 16 * 1024  # Write the data log once this many bytes are pending...
+LOG_FLUSH_INTERVAL = 5.0  # ...or after this many seconds, whichever comes first
+ROW_CODEGEN_ROWS = 100  # Rows without new columns before the row writer is specialized
+STATS_BATCH_ROWS = 64  # Rows collected before statistics are merged in one NumPy pass
+STATS_SAVE_INTERVAL = 600.0  # Save statistics at least every 10 minutes...
+STATS_SAVE_ROWS = 10000  # ...or after this many new data points, whichever comes first
+STATS_BUFFER_SIZE = 64 * 1024  # Holds a whole statistics save so it goes out in one write
+NUMBER_PATTERN = re.compile(rb'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+def try_float(value: Optional[bytes], _match=NUMBER_PATTERN.fullmatch) -> Optional[float]:
+    """Convert a numeric field to float, None for missing or non-numeric fields without raising."""
+    return float(value) if value and _match(value) else None
 
 @dataclass
 class SerialConfig:
@@ -35,27 +54,42 @@ class LoggingConfig:
     log_dir: str = "OUTPUT"
     max_log_size: int = LOG_ROTATION_SIZE
     save_stats: bool = True
+    stats_batch_seconds: float = STATS_SAVE_INTERVAL
+    stats_batch_rows: int = STATS_SAVE_ROWS
 
 class TrisonicaDataLoggerPi:
-    def __init__(self, port: str = 'auto', log_dir: str = None):
+    # "PARAM value" pairs; values stop at whitespace or the field separator
+    _TOKEN_RE = re.compile(rb'([A-Za-z][A-Za-z0-9_]*)\s+([^\s,]+)')
+    
+    def __init__(self, port: str = 'auto', log_dir: str = None,
+                 stats_batch_seconds: float = STATS_SAVE_INTERVAL, stats_batch_rows: int = STATS_SAVE_ROWS):
         """
         Initialize the TriSonica data logger for Raspberry Pi.
         """
         self.port = port
         self.log_dir = log_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), "OUTPUT")
+        self.stats_batch_seconds = stats_batch_seconds
+        self.stats_batch_rows = stats_batch_rows
         
         # Ensure log directory exists
         os.makedirs(self.log_dir, exist_ok=True)
         
         # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler(os.path.join(self.log_dir, 'datalogger.log'))
-            ]
-        )
+        # Records are queued and written by a listener thread, so console and
+        # SD card writes never block the serial read loop
+        log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        log_handlers = [
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler(os.path.join(self.log_dir, 'datalogger.log'))
+        ]
+        for handler in log_handlers:
+            handler.setFormatter(log_formatter)
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+        self.log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+        self.log_listener.start()
         self.logger = logging.getLogger(__name__)
         
         # Initialize variables
@@ -69,18 +103,35 @@ class TrisonicaDataLoggerPi:
         # CSV structure
         self.csv_columns = ['timestamp']
         self.csv_headers_written = False
+        self._log_fd = None
+        self._write_buf = bytearray()  # CSV rows waiting for the next os.write
+        self._last_flush = time.monotonic()
+        self._fast_write_row = None  # Row writer generated for the current column set
+        self._stable_rows = 0  # Rows seen since the column set last changed
+        self._stats_params = []  # Parameter order of the statistics block columns
+        self._stats_block = None  # Float rows awaiting a vectorized statistics merge
+        self._stats_rows = 0
         
         # Data storage for basic statistics (Pi-friendly small buffers)
         self.latest_data = {}
+        self._read_buf = b''  # Bytes received after the last complete line
         self.parameter_stats = {}
         
+        # Self-pipe: the interpreter writes the signal number here from the C handler,
+        # waking any select() in the main loop immediately
+        self._sig_r, self._sig_w = os.pipe()
+        os.set_blocking(self._sig_r, False)
+        os.set_blocking(self._sig_w, False)
+        signal.set_wakeup_fd(self._sig_w)
+        self.received_signal = None
+        
         # Setup signal handlers
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
         
     def signal_handler(self, signum, frame):
-        """Handle shutdown signals gracefully."""
-        self.logger.info(f"Received signal {signum}, shutting down...")
+        """Handle shutdown signals gracefully, only flags are touched here."""
+        self.received_signal = signum
         self.running = False
         
     def find_serial_ports(self) -> List[str]:
@@ -131,6 +182,15 @@ class TrisonicaDataLoggerPi:
             
             print(f"Connected to {selected_port} at 115200 baud")
             self.logger.info(f"Serial connection established: {selected_port}")
+            
+            # Ask USB-serial drivers (FTDI and friends) to deliver bytes immediately
+            # instead of holding them for their latency timer
+            try:
+                self.serial_connection.set_low_latency_mode(True)
+                self.logger.info("Serial low latency mode enabled")
+            except Exception as e:
+                self.logger.debug(f"Low latency mode not available: {e}")
+                
             return True
             
         except serial.SerialException as e:
@@ -143,14 +203,18 @@ class TrisonicaDataLoggerPi:
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H%M%S")
         self.log_filename = f"TrisonicaData_{timestamp}.csv"
         self.stats_filename = f"TrisonicaStats_{timestamp}.csv"
+        self.log_path = os.path.join(self.log_dir, self.log_filename)
+        self.stats_path = os.path.join(self.log_dir, self.stats_filename)
         
         try:
             # Open data log file
-            self.log_file = open(os.path.join(self.log_dir, self.log_filename), 'w', newline='')
+            # Unbuffered, rows are batched in _write_buf and written straight to the fd
+            self.log_file = open(self.log_path, 'wb', buffering=0)
+            self._log_fd = self.log_file.fileno()
             
             # Open stats file
-            self.stats_file = open(os.path.join(self.log_dir, self.stats_filename), 'w', newline='')
-            self.stats_file.write("timestamp,parameter,min,max,mean,std_dev,count\n")
+            self.stats_file = open(self.stats_path, 'wb', buffering=STATS_BUFFER_SIZE)
+            self.stats_file.write(b"timestamp,parameter,min,max,mean,std_dev,count\n")
             self.stats_file.flush()
             
             print(f"Logging to: {self.log_filename}")
@@ -162,37 +226,18 @@ class TrisonicaDataLoggerPi:
             self.logger.error(f"Failed to create log files: {e}")
             return False
     
-    def parse_trisonica_data(self, line: str) -> Optional[Dict[str, str]]:
-        """Parse a line of Trisonica data."""
+    def parse_trisonica_data(self, line: bytes) -> Optional[Dict[str, bytes]]:
+        """Parse a line of Trisonica data, values are kept as raw bytes."""
         try:
-            # Remove whitespace and split by commas
-            parts = line.strip().split(',')
-            
-            if len(parts) < 2:
-                return None
-                
-            parsed_data = {}
-            
-            # Parse each parameter
-            for part in parts:
-                part = part.strip()
-                if not part:
-                    continue
-                    
-                # Split by space to get parameter and value
-                tokens = part.split()
-                if len(tokens) >= 2:
-                    param = tokens[0]
-                    value = tokens[1]
-                    parsed_data[param] = value
-                    
+            # One C-level scan for every "PARAM value" pair, comma or space separated
+            parsed_data = {param.decode('ascii'): value for param, value in self._TOKEN_RE.findall(line)}
             return parsed_data if parsed_data else None
             
         except Exception as e:
             self.logger.debug(f"Error parsing line: {line.strip()}: {e}")
             return None
     
-    def update_csv_columns(self, parsed_data: Dict[str, str]):
+    def update_csv_columns(self, parsed_data: Dict[str, bytes]):
         """Update CSV columns based on new parameters found."""
         new_columns = False
         for key in parsed_data.keys():
@@ -200,54 +245,170 @@ class TrisonicaDataLoggerPi:
                 self.csv_columns.append(key)
                 new_columns = True
         
+        # Specialize the row writer once the column set has stopped changing
+        if new_columns:
+            self._fast_write_row = None
+            self._stable_rows = 0
+            self.stop_stats_block()
+        elif self._fast_write_row is None:
+            self._stable_rows += 1
+            if self._stable_rows >= ROW_CODEGEN_ROWS:
+                self._fast_write_row = self.build_row_writer()
+                self.start_stats_block()
+                self.logger.debug(f"Specialized CSV row writer for {len(self.csv_columns)} columns")
+        
         # Write headers if this is the first data or if new columns were added
         if not self.csv_headers_written:
-            self.log_file.write(','.join(self.csv_columns) + '\n')
+            self._write_buf += (','.join(self.csv_columns) + '\n').encode('ascii')
             self.csv_headers_written = True
             self.logger.info(f"CSV headers written: {self.csv_columns}")
     
-    def write_csv_row(self, timestamp: datetime.datetime, parsed_data: Dict[str, str]):
-        """Write a properly formatted CSV row."""
-        row_values = []
-        for column in self.csv_columns:
-            if column == 'timestamp':
-                row_values.append(timestamp.isoformat())
-            else:
-                # Get value for this column, or empty string if not present
-                value = parsed_data.get(column, '')
-                row_values.append(value)
+    def build_row_writer(self):
+        """Generate a row writer with the current columns unrolled into one expression."""
+        fields = ''.join(f" + b',' + get({column!r}, b'')" for column in self.csv_columns[1:])
+        source = (
+            "def _fast_write_row(row, timestamp, parsed_data):\n"
+            "    get = parsed_data.get\n"
+            f"    row += timestamp{fields} + b'\\n'\n"
+        )
+        namespace = {}
+        exec(source, namespace)
+        return namespace['_fast_write_row']
+    
+    def write_csv_row(self, timestamp: bytes, parsed_data: Dict[str, bytes]):
+        """Write a properly formatted CSV row, timestamp is already ISO formatted bytes."""
+        # Append the row as bytes to the pending batch, missing parameters are left empty
+        row = self._write_buf
+        if self._fast_write_row is not None:
+            self._fast_write_row(row, timestamp, parsed_data)
+        else:
+            row += timestamp
+            for column in self.csv_columns[1:]:
+                row.append(0x2C)  # ','
+                value = parsed_data.get(column)
+                if value:
+                    row += value
+            row.append(0x0A)  # '\n'
         
-        self.log_file.write(','.join(row_values) + '\n')
-        self.log_file.flush()
+        # Write in batches rather than per row to spare the SD card,
+        # the run loop writes out older rows once LOG_FLUSH_INTERVAL has passed
+        if len(row) >= WRITE_BATCH_SIZE:
+            self.flush_log()
+    
+    def flush_log(self):
+        """Write pending CSV rows to the data log."""
+        if self._write_buf and self.log_file and not self.log_file.closed:
+            pending = memoryview(self._write_buf)
+            while pending:
+                pending = pending[os.write(self._log_fd, pending):]
+            pending.release()
+            self._write_buf.clear()
+        self._last_flush = time.monotonic()
+    
+    def start_stats_block(self):
+        """Collect statistics in a fixed-shape NumPy block now that the columns are stable."""
+        if np is None:
+            return
+        self._stats_params = self.csv_columns[1:]
+        self._stats_block = np.empty((STATS_BATCH_ROWS, len(self._stats_params)))
+        self._stats_rows = 0
     
-    def update_statistics(self, parsed_data: Dict[str, str]):
+    def stop_stats_block(self):
+        """Merge any collected rows and go back to per-row statistics."""
+        self.merge_stats_block()
+        self._stats_block = None
+    
+    def merge_stats_block(self):
+        """Fold the collected rows into the running statistics with Chan's parallel update."""
+        if self._stats_block is None or not self._stats_rows:
+            return
+            
+        block = self._stats_block[:self._stats_rows]
+        self._stats_rows = 0
+        
+        # Per-parameter count, mean, M2, min and max of the block, missing values are NaN
+        valid = ~np.isnan(block)
+        counts = valid.sum(axis=0)
+        means = np.where(valid, block, 0.0).sum(axis=0) / np.maximum(counts, 1)
+        m2s = (np.where(valid, block - means, 0.0) ** 2).sum(axis=0)
+        mins = np.where(valid, block, np.inf).min(axis=0)
+        maxs = np.where(valid, block, -np.inf).max(axis=0)
+        
+        for i, param in enumerate(self._stats_params):
+            count_b = int(counts[i])
+            if not count_b:
+                continue
+            mean_b = float(means[i])
+            m2_b = float(m2s[i])
+            
+            stats = self.parameter_stats.get(param)
+            if stats is None:
+                self.parameter_stats[param] = {
+                    'min': float(mins[i]),
+                    'max': float(maxs[i]),
+                    'mean': mean_b,
+                    'M2': m2_b,
+                    'count': count_b
+                }
+            else:
+                if mins[i] < stats['min']:
+                    stats['min'] = float(mins[i])
+                if maxs[i] > stats['max']:
+                    stats['max'] = float(maxs[i])
+                count_a = stats['count']
+                count = count_a + count_b
+                delta = mean_b - stats['mean']
+                stats['mean'] += delta * count_b / count
+                stats['M2'] += m2_b + delta * delta * count_a * count_b / count
+                stats['count'] = count
+    
+    def update_statistics(self, parsed_data: Dict[str, bytes]):
         """Update simple statistics for parameters."""
+        if self._stats_block is not None:
+            # Stable columns: store the row and merge the whole block at once
+            row = []
+            get = parsed_data.get
+            for param in self._stats_params:
+                value = try_float(get(param))
+                row.append(np.nan if value is None else value)
+            self._stats_block[self._stats_rows] = row
+            self._stats_rows += 1
+            if self._stats_rows == STATS_BATCH_ROWS:
+                self.merge_stats_block()
+            return
+            
+        parameter_stats = self.parameter_stats
         for param, value_str in parsed_data.items():
-            try:
-                value = float(value_str)
+            value = try_float(value_str)
+            if value is None:
+                continue
                 
-                if param not in self.parameter_stats:
-                    self.parameter_stats[param] = {
-                        'min': value,
-                        'max': value,
-                        'sum': value,
-                        'count': 1,
-                        'values': deque(maxlen=100)  # Keep last 100 for std dev
-                    }
-                else:
-                    stats = self.parameter_stats[param]
-                    stats['min'] = min(stats['min'], value)
-                    stats['max'] = max(stats['max'], value)
-                    stats['sum'] += value
-                    stats['count'] += 1
-                    
-                self.parameter_stats[param]['values'].append(value)
-                    
-            except (ValueError, TypeError):
+            # One lookup per parameter, updates go through the local reference
+            stats = parameter_stats.get(param)
+            if stats is None:
+                parameter_stats[param] = {
+                    'min': value,
+                    'max': value,
+                    'mean': value,
+                    'M2': 0.0,  # Running sum of squared deviations (Welford)
+                    'count': 1
+                }
                 continue
+                
+            if value < stats['min']:
+                stats['min'] = value
+            if value > stats['max']:
+                stats['max'] = value
+            count = stats['count'] + 1
+            stats['count'] = count
+            delta = value - stats['mean']
+            mean = stats['mean'] + delta / count
+            stats['mean'] = mean
+            stats['M2'] += delta * (value - mean)
     
     def save_statistics(self):
         """Save current statistics to file."""
+        self.merge_stats_block()
         if not self.parameter_stats:
             return
             
@@ -257,33 +418,54 @@ class TrisonicaDataLoggerPi:
             if stats['count'] == 0:
                 continue
                 
-            mean = stats['sum'] / stats['count']
+            mean = stats['mean']
             
-            # Calculate standard deviation
-            values = list(stats['values'])
-            if len(values) > 1:
-                variance = sum((x - mean) ** 2 for x in values) / len(values)
-                std_dev = variance ** 0.5
-            else:
-                std_dev = 0.0
+            # Population standard deviation over the whole session, as on the other platforms
+            std_dev = (stats['M2'] / stats['count']) ** 0.5
             
             # Write to stats file
-            self.stats_file.write(f"{timestamp},{param},{stats['min']:.6f},{stats['max']:.6f},{mean:.6f},{std_dev:.6f},{stats['count']}\n")
+            self.stats_file.write(f"{timestamp},{param},{stats['min']:.6f},{stats['max']:.6f},"
+                                  f"{mean:.6f},{std_dev:.6f},{stats['count']}\n".encode('ascii'))
         
+        # One flush for all parameter rows
         self.stats_file.flush()
     
-    def read_and_process_data(self) -> bool:
-        """Read and process one line of data."""
+    def read_and_process_data(self) -> int:
+        """Read every byte waiting on the port and process each complete line, returns lines processed."""
         if not self.serial_connection or not self.serial_connection.is_open:
-            return False
+            return 0
             
         try:
-            # Read a line from serial
-            line = self.serial_connection.readline().decode('utf-8', errors='ignore').strip()
+            # One read for everything the driver has buffered
+            waiting = self.serial_connection.in_waiting
+            self._read_buf += self.serial_connection.read(waiting or 1)
+        except (serial.SerialException, OSError) as e:
+            # The port is gone (e.g. USB adapter unplugged) and select would keep
+            # reporting it readable, so stop instead of spinning on it
+            self.logger.error(f"Serial port lost: {e}")
+            self.running = False
+            return 0
+        except Exception as e:
+            self.logger.error(f"Error reading serial data: {e}")
+            return 0
             
-            if not line:
-                return False
-                
+        # Process complete lines, a trailing partial line waits for the next read
+        lines = self._read_buf.split(b'\n')
+        self._read_buf = lines.pop()
+        
+        processed = 0
+        process_line = self.process_line
+        for line in lines:
+            if process_line(line.strip()):
+                processed += 1
+        return processed
+    
+    def process_line(self, line: bytes) -> bool:
+        """Parse, log and accumulate statistics for one line of data."""
+        if not line:
+            return False
+            
+        try:
             # Parse the data
             parsed_data = self.parse_trisonica_data(line)
             
@@ -294,7 +476,7 @@ class TrisonicaDataLoggerPi:
             self.update_csv_columns(parsed_data)
             
             # Write to CSV
-            timestamp = datetime.datetime.now()
+            timestamp = datetime.datetime.now().isoformat().encode('ascii')
             self.write_csv_row(timestamp, parsed_data)
             
             # Update statistics
@@ -304,7 +486,7 @@ class TrisonicaDataLoggerPi:
             return True
             
         except Exception as e:
-            self.logger.error(f"Error reading serial data: {e}")
+            self.logger.error(f"Error processing serial data: {e}")
             return False
     
     def print_banner(self):
@@ -347,30 +529,55 @@ System Information:
             # Simple headless data collection loop
             self.start_time = datetime.datetime.now()
             self.running = True
-            last_status_time = time.time()
-            last_stats_time = time.time()
+            last_status_time = last_stats_time = time.monotonic()
+            last_stats_count = 0
+            
+            # Sleep in select() until the port has data or a signal arrives
+            try:
+                serial_fd = self.serial_connection.fileno()
+                wait_fds = [serial_fd, self._sig_r]
+            except Exception:
+                serial_fd = None
+                wait_fds = [self._sig_r]
+            
+            # Bind hot-loop callables to locals, saving global and attribute lookups per pass
+            _select = select.select
+            _monotonic = time.monotonic
+            _read = self.read_and_process_data
+            sig_r = self._sig_r
             
             while self.running:
                 try:
-                    if self.read_and_process_data():
-                        self.data_count += 1
+                    ready, _, _ = _select(wait_fds, [], [], SELECT_TIMEOUT)
+                    if sig_r in ready:
+                        os.read(sig_r, 64)
+                        continue
+                    if serial_fd is None or serial_fd in ready:
+                        self.data_count += _read()
                         
-                        current_time = time.time()
+                    # Housekeeping reads the clock once per wake, not once per sample
+                    current_time = _monotonic()
+                    
+                    # Write out rows that have waited longer than the flush interval
+                    if current_time - self._last_flush > LOG_FLUSH_INTERVAL:
+                        self.flush_log()
                         
-                        # Print status every 60 seconds
-                        if current_time - last_status_time >= 60:
-                            uptime = datetime.datetime.now() - self.start_time
-                            rate = self.data_count / uptime.total_seconds() if uptime.total_seconds() > 0 else 0
-                            print(f"Status: {self.data_count} data points collected, rate: {rate:.1f} Hz, file: {self.log_filename}")
-                            self.logger.info(f"Status: {self.data_count} data points, rate: {rate:.1f} Hz")
-                            last_status_time = current_time
+                    # Print status every 60 seconds
+                    if current_time - last_status_time >= 60:
+                        uptime = datetime.datetime.now() - self.start_time
+                        rate = self.data_count / uptime.total_seconds() if uptime.total_seconds() > 0 else 0
+                        print(f"Status: {self.data_count} data points collected, rate: {rate:.1f} Hz, file: {self.log_filename}")
+                        self.logger.info(f"Status: {self.data_count} data points, rate: {rate:.1f} Hz")
+                        self.flush_log()
+                        last_status_time = current_time
+                    
+                    # Save statistics on whichever of the time or row budget runs out first
+                    if (current_time - last_stats_time >= self.stats_batch_seconds or
+                            self.data_count - last_stats_count >= self.stats_batch_rows):
+                        self.save_statistics()
+                        last_stats_time = current_time
+                        last_stats_count = self.data_count
                         
-                        # Save statistics every 10 minutes
-                        if current_time - last_stats_time >= 600:
-                            self.save_statistics()
-                            last_stats_time = current_time
-                            
-                    time.sleep(UPDATE_INTERVAL)
                 except KeyboardInterrupt:
                     self.logger.info("Keyboard interrupt received")
                     break
@@ -390,23 +597,27 @@ System Information:
         """Cleanup resources before exit."""
         self.running = False
         
+        if self.received_signal is not None:
+            self.logger.info(f"Received signal {self.received_signal}, shutting down...")
+        
         # Save final statistics
         if self.parameter_stats:
             self.save_statistics()
         
         if hasattr(self, 'log_file') and self.log_file:
             try:
+                self.flush_log()
                 self.log_file.close()
-                print(f"\nLog file saved: {self.log_filename}")
-                self.logger.info(f"Log file saved: {self.log_filename}")
+                print(f"\nLog file saved: {self.log_path}")
+                self.logger.info(f"Log file saved: {self.log_path}")
             except Exception as e:
                 self.logger.error(f"Error closing log file: {e}")
         
         if hasattr(self, 'stats_file') and self.stats_file:
             try:
                 self.stats_file.close()
-                print(f"Stats file saved: {self.stats_filename}")
-                self.logger.info(f"Stats file saved: {self.stats_filename}")
+                print(f"Stats file saved: {self.stats_path}")
+                self.logger.info(f"Stats file saved: {self.stats_path}")
             except Exception as e:
                 self.logger.error(f"Error closing stats file: {e}")
         
@@ -418,6 +629,11 @@ System Information:
             except Exception as e:
                 self.logger.error(f"Error closing serial connection: {e}")
                 
+        # Detach and close the signal self-pipe
+        signal.set_wakeup_fd(-1)
+        os.close(self._sig_r)
+        os.close(self._sig_w)
+        
         # Final statistics
         if hasattr(self, 'data_count') and hasattr(self, 'start_time') and self.start_time:
             uptime = datetime.datetime.now() - self.start_time
@@ -431,18 +647,27 @@ System Information:
                 
         print("\nGoodbye!")
         self.logger.info("TriSonica Data Logger stopped")
+        
+        # Write out any queued log records
+        self.log_listener.stop()
 
 def main():
     parser = argparse.ArgumentParser(description='TriSonica Data Logger for Raspberry Pi')
     parser.add_argument('--port', default='auto', help='Serial port (default: auto-detect)')
     parser.add_argument('--log-dir', help='Directory for log files (default: OUTPUT)')
+    parser.add_argument('--stats-interval', type=float, default=STATS_SAVE_INTERVAL,
+                        help=f'Seconds between statistics saves (default: {STATS_SAVE_INTERVAL:.0f})')
+    parser.add_argument('--stats-rows', type=int, default=STATS_SAVE_ROWS,
+                        help=f'Data points between statistics saves (default: {STATS_SAVE_ROWS})')
     
     args = parser.parse_args()
     
     # Create and run logger
     logger = TrisonicaDataLoggerPi(
         port=args.port,
-        log_dir=args.log_dir
+        log_dir=args.log_dir,
+        stats_batch_seconds=args.stats_interval,
+        stats_batch_rows=args.stats_rows
     )
     
     logger.run()
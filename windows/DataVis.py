@@ -5,22 +5,22 @@ Enhanced with Windows-specific features and optimizations
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved to files; also safe in worker processes
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import re
 import os
+import mmap
 import glob
 import numpy as np
 import json
 import argparse
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import sys
 
-# Windows specific
-import tkinter as tk
-from tkinter import filedialog, messagebox
-
 try:
     from windrose import WindroseAxes
     windrose_installed = True
@@ -48,124 +48,193 @@ PLOT_METADATA = {
     'TD': ('True Heading', 'Direction (°)')
 }
 
+MAX_PLOT_POINTS = 4000  # Upper bound on points drawn per time series
+FORMAT_SNIFF_BYTES = 512  # Bytes read from the file head to detect its format
+SAVE_DPI = 150  # Resolution of saved PNGs; plenty for on-screen viewing
+SAVE_PAD_INCHES = 0.1  # Padding around the tight bounding box
+TIME_AXIS_FORMAT = '%H:%M'  # Tick label format on time series plots
+TIME_AXIS_HOURS = 1  # Hours between major ticks on time series plots
+TAGGED_INITIAL_ROWS = 4096  # Initial row capacity when parsing tagged logs
+TAGGED_INITIAL_PARAMS = 16  # Initial parameter capacity when parsing tagged logs
+
+# Precompiled patterns for the tagged log format. Surrounding whitespace and
+# line endings are absorbed by the patterns, so lines need no strip().
+_TS_RE = re.compile(r'^\s*(\S+ \S+)\s+-\s+(.*?)\s*$')  # "<date> <time> - <data>"
+_TAG_RE = re.compile(r'(\w+)\s+(-?\d+(?:\.\d+)?)')  # "PARAM VALUE" pairs
+
 def detect_log_format(file_path):
     """
     Detects the format of the log file (old tagged format vs new CSV format).
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline().strip()
-            second_line = f.readline().strip()
-            
-            # Check if first line contains 'timestamp' (CSV header)
-            if 'timestamp' in first_line.lower():
-                return 'csv'
-            
-            # Check if lines contain parameter-value pairs like "S1 12.34, T1 25.67"
-            if re.search(r'\w+\s+[\d\.-]+', first_line) or re.search(r'\w+\s+[\d\.-]+', second_line):
-                return 'tagged'
-            
-            return 'unknown'
+        # Sniff a fixed-size head rather than decoding whole lines
+        with open(file_path, 'rb') as f:
+            head = f.read(FORMAT_SNIFF_BYTES).decode('utf-8', 'replace')
+        
+        # Check if first line contains 'timestamp' (CSV header)
+        if 'timestamp' in head.split('\n', 1)[0].lower():
+            return 'csv'
+        
+        # Check for parameter-value pairs like "S1 12.34, T1 25.67"
+        if _TAG_RE.search(head):
+            return 'tagged'
+        
+        return 'unknown'
             
     except Exception as e:
         print(f"Error detecting format: {e}")
         return 'unknown'
 
+def grow_array(arr, rows=None, cols=None):
+    """
+    Return a NaN-filled copy of a 2D array enlarged to the given shape.
+    """
+    grown = np.full((rows or arr.shape[0], cols or arr.shape[1]), np.nan,
+                    dtype=arr.dtype, order='F')
+    grown[:arr.shape[0], :arr.shape[1]] = arr
+    return grown
+
 def parse_tagged_format(file_path):
     """
     Parse the old tagged format with embedded timestamps and parameter tags.
     Example line: "2023-10-15 14:30:25.123456 - S1 12.34, T1 25.67, D1 180.5"
     """
-    data_rows = []
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-                
-            try:
-                # Split timestamp and data
-                if ' - ' in line:
-                    timestamp_str, data_str = line.split(' - ', 1)
-                else:
-                    # Fallback: assume entire line is data with current timestamp
-                    timestamp_str = datetime.now().isoformat()
-                    data_str = line
-                
-                # Parse timestamp
-                try:
-                    timestamp = pd.to_datetime(timestamp_str)
-                except:
-                    timestamp = pd.to_datetime(datetime.now())
-                
-                # Parse data parameters
-                row_data = {'timestamp': timestamp}
-                
-                # Split by commas and parse parameter-value pairs
-                if ',' in data_str:
-                    pairs = data_str.split(',')
-                else:
-                    pairs = [data_str]
+    ts_strs = []
+    col_idx = {}  # param -> column in values, in first-seen order
+    # Column-major so each parameter ends up contiguous in the DataFrame
+    values = np.full((TAGGED_INITIAL_ROWS, TAGGED_INITIAL_PARAMS), np.nan,
+                     dtype=np.float64, order='F')
+    
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:  # mmap cannot map an empty file
+            raise ValueError("No valid data found in tagged format file")
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line_num, raw_line in enumerate(iter(mm.readline, b''), 1):
+                if raw_line.isspace():
+                    continue
+                line = raw_line.decode('utf-8', 'replace')
                     
-                for pair in pairs:
-                    pair = pair.strip()
-                    if not pair:
-                        continue
-                        
-                    # Look for pattern: PARAM VALUE
-                    match = re.match(r'(\w+)\s+([\d\.-]+)', pair)
+                try:
+                    # Split timestamp and data
+                    match = _TS_RE.match(line)
                     if match:
-                        param, value = match.groups()
-                        try:
-                            row_data[param] = float(value)
-                        except ValueError:
-                            row_data[param] = value
-                
-                if len(row_data) > 1:  # More than just timestamp
-                    data_rows.append(row_data)
+                        timestamp_str, data_str = match.groups()
+                    else:
+                        # Fallback: assume entire line is data with current timestamp
+                        timestamp_str = None
+                        data_str = line
                     
-            except Exception as e:
-                print(f"Warning: Could not parse line {line_num}: {line[:50]}... Error: {e}")
-                continue
+                    # Parse data parameters in a single scan of the data part
+                    pairs = _TAG_RE.findall(data_str)
+                    if pairs:
+                        row = len(ts_strs)
+                        if row == values.shape[0]:
+                            values = grow_array(values, rows=2 * row)
+                        for param, value in pairs:
+                            col = col_idx.get(param)
+                            if col is None:
+                                col = col_idx[param] = len(col_idx)
+                                if col == values.shape[1]:
+                                    values = grow_array(values, cols=2 * col)
+                            values[row, col] = float(value)
+                        ts_strs.append(timestamp_str)
+                        
+                except Exception as e:
+                    print(f"Warning: Could not parse line {line_num}: {line[:50]}... Error: {e}")
+                    continue
     
-    if not data_rows:
+    if not ts_strs:
         raise ValueError("No valid data found in tagged format file")
     
-    df = pd.DataFrame(data_rows)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    df = df.set_index('timestamp')
-    return df
+    # Parse all timestamps in one vectorized call; missing or unparseable
+    # ones fall back to the current time
+    index = pd.DatetimeIndex(
+        pd.to_datetime(ts_strs, format='ISO8601', errors='coerce', cache=True),
+        name='timestamp')
+    if index.hasnans:
+        index = index.fillna(pd.Timestamp(datetime.now()))
+    
+    values = values[:len(ts_strs), :len(col_idx)]
+    return pd.DataFrame(values, columns=list(col_idx), index=index)
 
 def parse_csv_format(file_path):
     """
     Parse the new CSV format with proper headers.
     """
     try:
-        df = pd.read_csv(file_path)
-        
-        # Convert timestamp column
-        if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df = df.set_index('timestamp')
+        # Parse the timestamp column into the index while reading, if present
+        has_timestamp = 'timestamp' in pd.read_csv(file_path, nrows=0).columns
+        if has_timestamp:
+            read_kwargs = {'parse_dates': ['timestamp'], 'index_col': 'timestamp'}
         else:
+            read_kwargs = {}
+        
+        # Prefer the multithreaded PyArrow reader, fall back to the C engine when
+        # PyArrow is missing or rejects the file (e.g. a truncated last row left by
+        # a killed logger; ArrowInvalid and ParserError are both ValueErrors)
+        try:
+            df = pd.read_csv(file_path, engine='pyarrow', **read_kwargs)
+        except (ImportError, ValueError):
+            df = pd.read_csv(file_path, **read_kwargs)
+        
+        if has_timestamp and not isinstance(df.index, pd.DatetimeIndex):
+            # The C engine leaves the index as text when any timestamp misses the
+            # inferred format (e.g. isoformat() dropping .ffffff); parse each one
+            # as ISO 8601 and drop rows that still fail
+            df.index = pd.DatetimeIndex(
+                pd.to_datetime(df.index, format='ISO8601', errors='coerce'), name='timestamp')
+            df = df[df.index.notna()]
+        
+        if not has_timestamp:
             # If no timestamp column, create one
             df.index = pd.date_range(start='2023-01-01', periods=len(df), freq='S')
-            
-        return df
+        
+        # Remove empty rows; the tagged parser never produces them
+        return df.dropna(how='all')
         
     except Exception as e:
         raise ValueError(f"Could not parse CSV format: {e}")
 
-def load_trisonica_data(file_path):
+def get_cache_path(file_path):
     """
-    Load and parse TriSonica data file, auto-detecting format.
+    Path of the Parquet cache kept next to a raw data file.
+    """
+    path = Path(file_path)
+    return path.with_name(path.name + '.parquet')  # Keeps data.csv and data.log apart
+
+def read_cached_data(file_path):
+    """
+    Return the cached DataFrame for a data file, or None if there is no
+    up-to-date cache (or no Parquet engine installed).
+    """
+    cache_path = get_cache_path(file_path)
+    try:
+        if cache_path.stat().st_mtime < os.path.getmtime(file_path):
+            return None
+        return pd.read_parquet(cache_path)
+    except (OSError, ImportError):
+        return None
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable cache {cache_path}: {e}")
+        return None
+
+def write_cached_data(df, file_path):
+    """
+    Save a parsed DataFrame as Parquet so repeat runs skip parsing.
+    """
+    cache_path = get_cache_path(file_path)
+    try:
+        df.to_parquet(cache_path, compression='zstd', index=True)
+    except ImportError:
+        pass  # No Parquet engine installed, caching is optional
+    except Exception as e:
+        print(f"Warning: Could not write cache {cache_path}: {e}")
+
+def parse_trisonica_file(file_path):
+    """
+    Parse a TriSonica data file into a cleaned numeric DataFrame.
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-    
-    print(f"Loading data from: {file_path}")
-    
     # Detect format
     format_type = detect_log_format(file_path)
     print(f"Detected format: {format_type}")
@@ -189,7 +258,25 @@ def load_trisonica_data(file_path):
     
     # Clean and validate data
     df = df.select_dtypes(include=[np.number])  # Keep only numeric columns
-    df = df.dropna(how='all')  # Remove rows with all NaN values
+    
+    return df
+
+def load_trisonica_data(file_path):
+    """
+    Load and parse TriSonica data file, auto-detecting format.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+    
+    print(f"Loading data from: {file_path}")
+    
+    # Reuse the Parquet cache from an earlier run when it is still current
+    df = read_cached_data(file_path)
+    if df is not None:
+        print(f"Using cached data: {get_cache_path(file_path)}")
+    else:
+        df = parse_trisonica_file(file_path)
+        write_cached_data(df, file_path)
     
     print(f"Loaded {len(df)} data points with {len(df.columns)} parameters")
     print(f"Available parameters: {list(df.columns)}")
@@ -197,6 +284,42 @@ def load_trisonica_data(file_path):
     
     return df
 
+def downsample_series(x, y, n_out=MAX_PLOT_POINTS):
+    """
+    Reduce a series to about n_out points for plotting.
+    Keeps the min and max of each bucket so spikes stay visible.
+    """
+    # Drop missing samples here so lines are drawn through them, not broken
+    missing = np.isnan(y)
+    if missing.any():
+        x, y = x[~missing], y[~missing]
+    
+    if len(y) <= n_out:
+        return x, y
+    
+    # Pad the last bucket with the final value so no tail points are dropped
+    size = -(-len(y) // (n_out // 2))
+    n_buckets = -(-len(y) // size)
+    padded = np.concatenate([y, np.full(n_buckets * size - len(y), y[-1])])
+    buckets = padded.reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    
+    idx = np.concatenate([
+        buckets.argmin(axis=1) + offsets,
+        buckets.argmax(axis=1) + offsets,
+        [0, len(y) - 1]
+    ])
+    idx = np.unique(np.minimum(idx, len(y) - 1))  # Sorted, so points stay in time order
+    return x[idx], y[idx]
+
+def save_figure(fig, output_path):
+    """
+    Save a figure as PNG, cropped to a tight bounding box computed once
+    (bbox_inches='tight' would lay the figure out a second time).
+    """
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(SAVE_PAD_INCHES)
+    fig.savefig(output_path, format='png', dpi=SAVE_DPI, bbox_inches=bbox)
+
 def create_time_series_plot(df, parameter, title=None, ax=None):
     """
     Create a time series plot for a specific parameter.
@@ -209,15 +332,16 @@ def create_time_series_plot(df, parameter, title=None, ax=None):
         fig, ax = plt.subplots(figsize=(12, 6))
     
     # Get data and metadata
-    data = df[parameter].dropna()
-    if len(data) == 0:
+    data = df[parameter]
+    if data.count() == 0:
         print(f"Warning: No valid data for parameter '{parameter}'")
         return None
     
     param_title, param_unit = PLOT_METADATA.get(parameter, (parameter, 'Unknown'))
     
-    # Plot the data
-    ax.plot(data.index, data.values, linewidth=1, alpha=0.8, label=param_title)
+    # Plot the data, decimated to what the figure can actually show
+    x, y = downsample_series(data.index, data.values)
+    ax.plot(x, y, linewidth=1, alpha=0.8, label=param_title)
     
     # Formatting
     ax.set_xlabel('Time')
@@ -226,9 +350,9 @@ def create_time_series_plot(df, parameter, title=None, ax=None):
     ax.grid(True, alpha=0.3)
     ax.legend()
     
-    # Format x-axis
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-    ax.xaxis.set_major_locator(mdates.HourLocator(interval=1))
+    # Format x-axis (locators track their own axis, so each axes gets new instances)
+    ax.xaxis.set_major_formatter(mdates.DateFormatter(TIME_AXIS_FORMAT))
+    ax.xaxis.set_major_locator(mdates.HourLocator(interval=TIME_AXIS_HOURS))
     plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
     
     return ax
@@ -259,22 +383,27 @@ def create_wind_rose(df, output_dir):
         print("Wind speed or direction data not available for wind rose")
         return None
     
-    # Clean data
-    wind_data = df[[wind_speed_col, wind_dir_col]].dropna()
-    if len(wind_data) < 10:
+    # Clean data: keep samples where both speed and direction are present
+    speed = df[wind_speed_col].to_numpy()
+    direction = df[wind_dir_col].to_numpy()
+    valid = ~(np.isnan(speed) | np.isnan(direction))
+    if valid.sum() < 10:
         print("Insufficient wind data for wind rose plot")
         return None
     
-    # Create wind rose
+    # Create wind rose (windrose bins the samples itself with np.histogram2d)
     fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection="windrose"))
-    ax.bar(wind_data[wind_dir_col], wind_data[wind_speed_col], normed=True, opening=0.8, edgecolor='white')
+    ax.bar(direction[valid], speed[valid], normed=True, opening=0.8, edgecolor='white')
     ax.set_legend(title='Wind Speed (m/s)', loc='upper left', bbox_to_anchor=(1.1, 1))
     ax.set_title('Wind Rose Diagram', pad=20)
     
     # Save plot
     output_path = os.path.join(output_dir, 'WindRose.png')
     plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    # Write to a private file first: files processed in parallel share this name
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    save_figure(fig, tmp_path)
+    os.replace(tmp_path, output_path)
     plt.close()
     
     print(f"Wind rose saved: {output_path}")
@@ -318,7 +447,7 @@ def create_summary_plot(df, output_dir, base_filename):
     
     # Save plot
     output_path = os.path.join(output_dir, f'Summary_{base_filename}.png')
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    save_figure(fig, output_path)
     plt.close()
     
     print(f"Summary plot saved: {output_path}")
@@ -330,23 +459,26 @@ def create_individual_plots(df, output_dir, base_filename):
     """
     plot_paths = []
     
+    # One figure is reused for every parameter; the axes are cleared in between
+    fig, ax = plt.subplots(figsize=(12, 6))
+    
     for param in df.columns:
         if param in PLOT_METADATA:
             param_title, param_unit = PLOT_METADATA[param]
             
-            fig, ax = plt.subplots(figsize=(12, 6))
+            ax.cla()
             create_time_series_plot(df, param, ax=ax)
             
             # Save individual plot
             safe_param = re.sub(r'[^\w\-_\.]', '_', param)
             output_path = os.path.join(output_dir, f'{safe_param}_{base_filename}.png')
-            plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.tight_layout()
+            save_figure(fig, output_path)
             
             plot_paths.append(output_path)
             print(f"Individual plot saved: {output_path}")
     
+    plt.close(fig)
     return plot_paths
 
 def save_statistics(df, output_dir, base_filename):
@@ -355,17 +487,21 @@ def save_statistics(df, output_dir, base_filename):
     """
     stats = {}
     
-    for param in df.columns:
-        if param in PLOT_METADATA:
-            data = df[param].dropna()
-            if len(data) > 0:
+    params = [col for col in df.columns if col in PLOT_METADATA]
+    if params:
+        # One describe() pass over all columns, on the full-precision data
+        desc = df[params].describe(percentiles=[0.5]).T
+        desc = desc.rename(columns={'50%': 'median'})
+        
+        for param, row in desc.iterrows():
+            if row['count'] > 0:
                 stats[param] = {
-                    'count': int(len(data)),
-                    'mean': float(data.mean()),
-                    'std': float(data.std()),
-                    'min': float(data.min()),
-                    'max': float(data.max()),
-                    'median': float(data.median()),
+                    'count': int(row['count']),
+                    'mean': float(row['mean']),
+                    'std': float(row['std']),
+                    'min': float(row['min']),
+                    'max': float(row['max']),
+                    'median': float(row['median']),
                     'description': PLOT_METADATA[param][0],
                     'unit': PLOT_METADATA[param][1]
                 }
@@ -390,6 +526,10 @@ def select_file_gui():
     Use Windows file dialog to select input file.
     """
     try:
+        # Imported here so batch and worker processes never load Tk
+        import tkinter as tk
+        from tkinter import filedialog
+        
         root = tk.Tk()
         root.withdraw()  # Hide the main window
         
@@ -486,15 +626,28 @@ def main():
         
         print(f"Found {len(csv_files)} CSV files to process")
         
-        for csv_file in csv_files:
-            print(f"\nProcessing: {os.path.basename(csv_file)}")
-            output_dir = args.output_dir or os.path.join(input_path, 'PLOTS')
-            process_data_file(
-                csv_file, 
-                output_dir, 
-                create_individual=not args.no_individual,
-                create_windrose=not args.no_windrose
-            )
+        # Files are independent, so process them in parallel
+        output_dir = args.output_dir or os.path.join(input_path, 'PLOTS')
+        max_workers = min(len(csv_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    process_data_file,
+                    csv_file,
+                    output_dir,
+                    create_individual=not args.no_individual,
+                    create_windrose=not args.no_windrose
+                ): csv_file
+                for csv_file in csv_files
+            }
+            for future in as_completed(futures):
+                csv_file = futures[future]
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    ok = False
+                    print(f"Error processing {os.path.basename(csv_file)}: {e}")
+                print(f"\n{'✓' if ok else '✗'} Finished: {os.path.basename(csv_file)}")
     else:
         # Process single file
         print(f"Processing: {os.path.basename(input_path)}")
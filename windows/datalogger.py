@@ -14,11 +14,13 @@ import os
 import glob
 import argparse
 import threading
-from collections import deque
+import io
 from typing import Dict, Optional, List
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+
 # Windows optimized imports
 from rich.console import Console
 from rich.live import Live
@@ -41,8 +43,29 @@ import win32api
 # --- Configuration ---
 DEFAULT_BAUD_RATE = 115200
 MAX_DATAPOINTS = 2000  # More data points on Windows
-UPDATE_INTERVAL = 0.03  # Fastest updates on Windows
+UPDATE_INTERVAL = 0.1  # Display refresh; faster than this can't be read anyway
 LOG_ROTATION_SIZE = 100 * 1024 * 1024  # 100MB logs on Windows
+STATS_WINDOW = 200  # Samples in the rolling mean/std window
+SERIAL_READ_BUFFER = 8192  # Userspace buffer in front of the serial port
+SERIAL_RX_BUFFER = 65536  # Driver receive buffer requested on Windows
+LOG_BATCH_ROWS = 64  # CSV rows collected before one write + flush
+LOG_FLUSH_INTERVAL = 0.5  # Max seconds a CSV row waits in the batch
+MEMORY_SAMPLE_INTERVAL = 5.0  # Seconds between re-estimating bytes per stored point
+VIZ_POINTS = 100  # Samples kept per visualization series
+ROW_CODEGEN_SAMPLES = 100  # Samples without new columns before the row formatter is specialized
+RATE_INTERVAL = 1.0  # Seconds of samples averaged into the displayed update rate
+IDLE_REFRESH_INTERVAL = 0.5  # Redraw period while no new samples arrive (keeps the clock ticking)
+DETECT_SETTLE = 0.2  # Seconds to let a probed port fill its receive buffer
+DETECT_FALLBACK_BYTES = 512  # Blocking probe read for slow senders
+
+# One visualization row per sample; series missing from a sample are NaN
+VIZ_DTYPE = np.dtype([('ts_ns', '<i8'), ('wind_speed', '<f4'), ('temperature', '<f4'), ('wind_direction', '<f4')])
+# Parameter -> visualization series it feeds
+VIZ_ROUTES = {'S': 'wind_speed', 'S2': 'wind_speed', 'T': 'temperature', 'D': 'wind_direction'}
+# Parameter family (first letter) -> (unit, valid min, valid max) for the live table
+QUALITY_RULES = {'S': ("m/s", 0, 50), 'T': ("°C", -40, 60)}
+# Parameters that identify a Trisonica stream during port detection
+_TRISONICA_RE = re.compile(rb'\b(?:S1|S2|S3|T1|T2)\b')
 
 @dataclass
 class Config:
@@ -57,9 +80,10 @@ class Config:
 
 @dataclass
 class DataPoint:
-    timestamp: datetime.datetime
+    timestamp_ns: int  # time.time_ns() at arrival
     raw_data: str
-    parsed_data: Dict[str, str] = field(default_factory=dict)
+    parsed_data: Dict[str, str] = field(default_factory=dict)  # Original text, as logged
+    values: Dict[str, float] = field(default_factory=dict)
 
 @dataclass
 class Statistics:
@@ -69,45 +93,85 @@ class Statistics:
     current_val: float = 0.0
     std_dev: float = 0.0
     count: int = 0
-    values: deque = field(default_factory=lambda: deque(maxlen=200))
+    # Ring buffer of the last STATS_WINDOW samples with running totals
+    values: List[float] = field(default_factory=list)
+    head: int = 0
+    running_sum: float = 0.0
+    running_sumsq: float = 0.0
+
+class SerialRawReader(io.RawIOBase):
+    """Raw stream that returns whatever the port has buffered (at least one byte)"""
+    def __init__(self, port: serial.Serial):
+        self.port = port
+        
+    def readable(self) -> bool:
+        return True
+        
+    def readinto(self, buffer) -> int:
+        data = self.port.read(min(len(buffer), self.port.in_waiting or 1))
+        buffer[:len(data)] = data
+        return len(data)
 
 class TrisonicaDataLoggerWindows:
+    # "KEY value" pairs; works for both comma- and space-separated lines
+    _KV_RE = re.compile(r'([A-Za-z]\w*)\s+(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)')
+    _BEEPS = {'ok': winsound.MB_OK, 'hand': winsound.MB_ICONHAND, 'warn': winsound.MB_ICONEXCLAMATION}
+    
     def __init__(self, config: Config):
         self.config = config
         self.serial_port = None
-        self.log_file = None
+        self._reader = None
+        self._partial = b''  # Start of a line whose read timed out before the newline
+        self._read_error = None  # Error that stopped ingest, reported after the display closes
+        self._log_fd = None
         self.stats_file = None
         self.console = Console()
         self.running = False
         self.start_time = time.time()
         
-        # Data storage
-        self.data_points = deque(maxlen=MAX_DATAPOINTS)
+        # Data storage: fixed-size ring of recent DataPoints, _ring_head is the next slot
+        self._ring: List[Optional[DataPoint]] = [None] * MAX_DATAPOINTS
+        self._ring_head = 0
+        self._ring_full = False
         self.point_count = 0
         self.stats = {}
+        self._ingest_thread = None
+        self._bytes_per_point = 0
+        self._last_memory_sample = 0.0
+        self._last_rendered_point_count = -1
+        self._last_render = 0.0
         
         # CSV column management
         self.csv_columns = ['timestamp']
+        self._csv_col_set = {'timestamp'}
+        self._csv_data_cols = ()  # csv_columns without 'timestamp'
+        self._fast_row = None  # Row formatter generated for the current column set
+        self._stable_samples = 0  # Samples seen since the column set last changed
         self.csv_headers_written = False
+        self._row_buf: List[str] = []
+        self._last_flush = time.monotonic()
         
         # Windows specific
-        self.last_update = time.time()
         self.update_rate = 0.0
+        self._rate_t0 = time.time()
+        self._rate_count0 = 0  # point_count at _rate_t0
         self.system_info = self.get_system_info()
         
-        # Visualization data storage
-        self.viz_data = {
-            'wind_speed': deque(maxlen=100),
-            'temperature': deque(maxlen=100),
-            'wind_direction': deque(maxlen=100),
-            'timestamps': deque(maxlen=100)
-        }
+        # Visualization data storage: one structured ring buffer, _viz_head is the next row
+        self._viz = np.zeros(VIZ_POINTS, dtype=VIZ_DTYPE)
+        self._viz_head = 0
+        self._viz_size = 0
+        
+        # Cached "YYYY-MM-DDTHH:MM:SS" prefix for CSV timestamps (ingest thread only)
+        self._ts_second = None
+        self._ts_prefix = ''
         
         # Ensure log directory exists
         os.makedirs(config.log_dir, exist_ok=True)
         
         # Setup logging
         self.setup_logging()
+        self.build_display_tables()
         
         # Signal handlers (Windows compatible)
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -156,6 +220,19 @@ class TrisonicaDataLoggerWindows:
         self.console.print(f"Sound Alerts: {'Enabled' if self.config.enable_sound else 'Disabled'}")
         self.console.print("─" * 70)
         
+    def _beep(self, kind: str):
+        """Play a system sound on a daemon thread so the caller never waits on it"""
+        if self.config.enable_sound:
+            threading.Thread(target=self._play_beep, args=(self._BEEPS[kind],), daemon=True).start()
+            
+    @staticmethod
+    def _play_beep(code: int):
+        """MessageBeep, ignoring failures such as a missing sound device"""
+        try:
+            winsound.MessageBeep(code)
+        except:
+            pass
+            
     def find_serial_ports(self) -> List[str]:
         """Find Windows serial ports"""
         import serial.tools.list_ports
@@ -172,11 +249,7 @@ class TrisonicaDataLoggerWindows:
         
         if not ports:
             self.console.print("[ERROR] No serial ports found!", style="bold red")
-            if self.config.enable_sound:
-                try:
-                    winsound.MessageBeep(winsound.MB_ICONHAND)
-                except:
-                    pass
+            self._beep('hand')
             return None
             
         self.console.print(f"[INFO] Found {len(ports)} serial port(s):")
@@ -189,26 +262,24 @@ class TrisonicaDataLoggerWindows:
                 self.console.print(f"[TEST] Testing {port}...", end="")
                 ser = serial.Serial(port, self.config.baud_rate, timeout=2)
                 
-                # Read several lines to detect Trisonica
+                # Let the port buffer some data, then scan it in one read
                 trisonica_detected = False
-                for _ in range(15):  # More attempts on Windows
-                    try:
-                        line = ser.readline().decode('ascii', errors='ignore').strip()
-                        if line and any(param in line for param in ['S1', 'S2', 'S3', 'T1', 'T2']):
-                            trisonica_detected = True
-                            break
-                    except:
-                        continue
-                        
+                try:
+                    time.sleep(DETECT_SETTLE)
+                    if ser.in_waiting:
+                        buf = ser.read(ser.in_waiting)
+                    else:
+                        buf = ser.read(DETECT_FALLBACK_BYTES)
+                    if _TRISONICA_RE.search(buf):
+                        trisonica_detected = True
+                except:
+                    pass
+                    
                 ser.close()
                 
                 if trisonica_detected:
                     self.console.print(" [SUCCESS] Trisonica detected!", style="bold green")
-                    if self.config.enable_sound:
-                        try:
-                            winsound.MessageBeep(winsound.MB_OK)
-                        except:
-                            pass
+                    self._beep('ok')
                     return port
                 else:
                     self.console.print(" [FAIL] No Trisonica data", style="dim")
@@ -217,11 +288,7 @@ class TrisonicaDataLoggerWindows:
                 self.console.print(f" [ERROR] {e}", style="red")
                 
         self.console.print("[WARNING] No Trisonica devices found", style="bold yellow")
-        if self.config.enable_sound:
-            try:
-                winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
-            except:
-                pass
+        self._beep('warn')
         return None
         
     def setup_logging(self):
@@ -231,7 +298,8 @@ class TrisonicaDataLoggerWindows:
         # Data log
         self.log_filename = f"TrisonicaData_{timestamp}.csv"
         self.log_path = os.path.join(self.config.log_dir, self.log_filename)
-        self.log_file = open(self.log_path, 'w', newline='', encoding='utf-8')
+        # Raw descriptor: each batch is one os.write with no Python-level buffering
+        self._log_fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0), 0o644)
         
         # Statistics log
         if self.config.save_statistics:
@@ -247,7 +315,7 @@ class TrisonicaDataLoggerWindows:
     def signal_handler(self, signum, frame):
         """Enhanced signal handler for Windows"""
         self.console.print(f"\n[SHUTDOWN] Received signal {signum}, saving data and shutting down...", style="bold yellow")
-        self.save_final_statistics()
+        # The ingest thread owns the log buffers; run() saves once it has stopped
         self.running = False
         
     def connect_serial(self) -> bool:
@@ -261,6 +329,10 @@ class TrisonicaDataLoggerWindows:
             
         try:
             self.serial_port = serial.Serial(port, self.config.baud_rate, timeout=1)
+            if hasattr(self.serial_port, 'set_buffer_size'):
+                self.serial_port.set_buffer_size(rx_size=SERIAL_RX_BUFFER)
+            # One driver read pulls in every waiting line instead of a byte at a time
+            self._reader = io.BufferedReader(SerialRawReader(self.serial_port), buffer_size=SERIAL_READ_BUFFER)
             self.console.print(f"[SUCCESS] Connected to {port} at {self.config.baud_rate:,} baud", style="bold green")
             return True
         except serial.SerialException as e:
@@ -271,21 +343,7 @@ class TrisonicaDataLoggerWindows:
         """Enhanced parsing with better error handling"""
         parsed = {}
         try:
-            if ',' in line:
-                pairs = line.strip().split(',')
-                for pair in pairs:
-                    pair = pair.strip()
-                    if ' ' in pair:
-                        parts = pair.split(' ', 1)
-                        if len(parts) == 2:
-                            key, value = parts
-                            parsed[key.strip()] = value.strip()
-            else:
-                parts = line.strip().split()
-                for i in range(0, len(parts)-1, 2):
-                    if i+1 < len(parts):
-                        parsed[parts[i]] = parts[i+1]
-                        
+            parsed = dict(self._KV_RE.findall(line))
         except Exception as e:
             pass
             
@@ -295,26 +353,72 @@ class TrisonicaDataLoggerWindows:
         """Update CSV columns based on new parameters found"""
         new_columns = False
         for key in parsed_data.keys():
-            if key not in self.csv_columns:
+            if key not in self._csv_col_set:
                 self.csv_columns.append(key)
+                self._csv_col_set.add(key)
                 new_columns = True
+                
+        # Specialize the row formatter once the column set has stopped changing
+        if new_columns:
+            self._csv_data_cols = tuple(self.csv_columns[1:])
+            self._fast_row = None
+            self._stable_samples = 0
+        elif self._fast_row is None:
+            self._stable_samples += 1
+            if self._stable_samples >= ROW_CODEGEN_SAMPLES:
+                self._fast_row = self.build_row_formatter()
         
         if not self.csv_headers_written:
-            self.log_file.write(','.join(self.csv_columns) + '\n')
+            os.write(self._log_fd, (','.join(self.csv_columns) + '\n').encode('utf-8'))
             self.csv_headers_written = True
             
-    def write_csv_row(self, timestamp: datetime.datetime, parsed_data: Dict[str, str]):
-        """Write a properly formatted CSV row"""
-        row_values = []
-        for column in self.csv_columns:
-            if column == 'timestamp':
-                row_values.append(timestamp.isoformat())
-            else:
-                value = parsed_data.get(column, '')
-                row_values.append(value)
+    def format_timestamp(self, timestamp_ns: int) -> str:
+        """Local ISO 8601 timestamp with microseconds, reusing the prefix within a second"""
+        seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+        if seconds != self._ts_second:
+            self._ts_second = seconds
+            self._ts_prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+        return f"{self._ts_prefix}.{nanoseconds // 1000:06d}"
+        
+    @staticmethod
+    def format_clock(timestamp_ns: int) -> str:
+        """Local HH:MM:SS.mmm for the display"""
+        seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+        return f"{time.strftime('%H:%M:%S', time.localtime(seconds))}.{nanoseconds // 1_000_000:03d}"
+        
+    def build_row_formatter(self):
+        """Generate a row formatter with the current columns unrolled into one expression"""
+        fields = ''.join(f" + ',' + get({column!r}, '')" for column in self._csv_data_cols)
+        source = (
+            "def _fast_row(parsed_data, timestamp):\n"
+            "    get = parsed_data.get\n"
+            f"    return timestamp{fields}\n"
+        )
+        namespace = {}
+        exec(source, namespace)
+        return namespace['_fast_row']
         
-        self.log_file.write(','.join(row_values) + '\n')
-        self.log_file.flush()
+    def write_csv_row(self, timestamp_ns: int, parsed_data: Dict[str, str]):
+        """Write a properly formatted CSV row"""
+        if self._fast_row is not None:
+            self._row_buf.append(self._fast_row(parsed_data, self.format_timestamp(timestamp_ns)))
+        else:
+            row_values = [self.format_timestamp(timestamp_ns)]
+            row_values += [parsed_data.get(column, '') for column in self._csv_data_cols]
+            self._row_buf.append(','.join(row_values))
+            
+        if len(self._row_buf) >= LOG_BATCH_ROWS or time.monotonic() - self._last_flush > LOG_FLUSH_INTERVAL:
+            self.flush_csv_rows()
+            
+    def flush_csv_rows(self):
+        """Write the batched CSV rows, normally with a single os.write"""
+        if self._row_buf and self._log_fd is not None:
+            # os.write may write less than asked; finish the remainder
+            pending = memoryview(('\n'.join(self._row_buf) + '\n').encode('utf-8'))
+            while pending:
+                pending = pending[os.write(self._log_fd, pending):]
+            self._row_buf.clear()
+        self._last_flush = time.monotonic()
         
     def calculate_statistics(self, key: str, value: float):
         """Enhanced statistics with standard deviation"""
@@ -324,7 +428,23 @@ class TrisonicaDataLoggerWindows:
         stat = self.stats[key]
         stat.current_val = value
         stat.count += 1
-        stat.values.append(value)
+        
+        # Update the rolling window in O(1), dropping the evicted sample's totals
+        if len(stat.values) < STATS_WINDOW:
+            stat.values.append(value)
+            stat.running_sum += value
+            stat.running_sumsq += value * value
+        else:
+            old = stat.values[stat.head]
+            stat.values[stat.head] = value
+            stat.head = (stat.head + 1) % STATS_WINDOW
+            if stat.head == 0:
+                # Resync once per lap so float error can't accumulate
+                stat.running_sum = sum(stat.values)
+                stat.running_sumsq = sum(x * x for x in stat.values)
+            else:
+                stat.running_sum += value - old
+                stat.running_sumsq += value * value - old * old
         
         if stat.count == 1:
             stat.min_val = stat.max_val = stat.mean_val = value
@@ -333,52 +453,93 @@ class TrisonicaDataLoggerWindows:
             stat.min_val = min(stat.min_val, value)
             stat.max_val = max(stat.max_val, value)
             
-            stat.mean_val = sum(stat.values) / len(stat.values)
-            
-            if len(stat.values) > 1:
-                variance = sum((x - stat.mean_val) ** 2 for x in stat.values) / len(stat.values)
-                stat.std_dev = variance ** 0.5
+            size = len(stat.values)
+            stat.mean_val = stat.running_sum / size
+            variance = stat.running_sumsq / size - stat.mean_val * stat.mean_val
+            stat.std_dev = max(variance, 0.0) ** 0.5
                 
+    def ring_push(self, data_point: DataPoint):
+        """Store a DataPoint, overwriting the oldest once the ring is full"""
+        # Fill the slot before advancing the head so the display never sees an empty latest
+        self._ring[self._ring_head] = data_point
+        self._ring_head = (self._ring_head + 1) % MAX_DATAPOINTS
+        if self._ring_head == 0:
+            self._ring_full = True
+            
+    def ring_size(self) -> int:
+        """Number of DataPoints currently stored"""
+        return MAX_DATAPOINTS if self._ring_full else self._ring_head
+        
+    def ring_recent(self, count: int) -> List[DataPoint]:
+        """The last `count` DataPoints, oldest first"""
+        head = self._ring_head
+        count = min(count, self.ring_size())
+        return [self._ring[(head - i) % MAX_DATAPOINTS] for i in range(count, 0, -1)]
+        
+    def viz_push(self, timestamp_ns: int, series: Dict[str, float]):
+        """Store one sample's visualization values as a row of the ring buffer"""
+        nan = float('nan')
+        self._viz[self._viz_head] = (timestamp_ns, series.get('wind_speed', nan),
+                                     series.get('temperature', nan), series.get('wind_direction', nan))
+        self._viz_head = (self._viz_head + 1) % VIZ_POINTS
+        if self._viz_size < VIZ_POINTS:
+            self._viz_size += 1
+            
+    def viz_rows(self) -> np.ndarray:
+        """Return the visualization rows in arrival order (oldest first)"""
+        if self._viz_size < VIZ_POINTS:
+            return self._viz[:self._viz_size]
+        return np.roll(self._viz, -self._viz_head)
+        
+    def viz_series(self, series: str) -> np.ndarray:
+        """Return one visualization series in arrival order (oldest first)"""
+        return self.viz_rows()[series]
+        
     def read_serial_data(self) -> Optional[DataPoint]:
         """Enhanced data reading with performance metrics"""
         if not self.serial_port or not self.serial_port.is_open:
             return None
             
         try:
-            line = self.serial_port.readline().decode('ascii', errors='ignore').strip()
+            raw = self._reader.readline()
+            if not raw.endswith(b'\n'):
+                # A read timeout ends readline early; keep the fragment for the next call
+                self._partial += raw
+                return None
+            if self._partial:
+                raw = self._partial + raw
+                self._partial = b''
+            line = raw.decode('ascii', errors='ignore').strip()
             if not line:
                 return None
                 
-            timestamp = datetime.datetime.now()
+            timestamp_ns = time.time_ns()
             parsed = self.parse_data_line(line)
             
             self.update_csv_columns(parsed)
-            self.write_csv_row(timestamp, parsed)
+            self.write_csv_row(timestamp_ns, parsed)
             
-            for key, value_str in parsed.items():
-                try:
-                    value = float(value_str)
-                    self.calculate_statistics(key, value)
-                    
-                    if key in ['S', 'S2']:
-                        self.viz_data['wind_speed'].append(value)
-                    elif key == 'T':
-                        self.viz_data['temperature'].append(value)
-                    elif key == 'D':
-                        self.viz_data['wind_direction'].append(value)
-                        
-                except ValueError:
-                    pass
-                    
-            self.viz_data['timestamps'].append(timestamp)
+            # _KV_RE only captures float literals, so float() cannot fail here
+            values = {key: float(value_str) for key, value_str in parsed.items()}
+            viz = {}
+            for key, value in values.items():
+                self.calculate_statistics(key, value)
+                
+                # First parameter on the line wins when several feed one series (S before S2)
+                series = VIZ_ROUTES.get(key)
+                if series is not None and series not in viz:
+                    viz[series] = value
                     
-            now = time.time()
-            if now - self.last_update > 0:
-                self.update_rate = 1.0 / (now - self.last_update)
-            self.last_update = now
+            self.viz_push(timestamp_ns, viz)
             
-            return DataPoint(timestamp, line, parsed)
+            return DataPoint(timestamp_ns, line, parsed, values)
             
+        except OSError as e:
+            # SerialException is an OSError too; the port is gone (e.g. adapter
+            # unplugged) and every read would fail at once, so stop ingest
+            self._read_error = e
+            self.running = False
+            return None
         except Exception as e:
             return None
             
@@ -388,10 +549,12 @@ class TrisonicaDataLoggerWindows:
             return
             
         timestamp = datetime.datetime.now().isoformat()
-        for key, stat in self.stats.items():
-            self.stats_file.write(f"{timestamp},{key},{stat.min_val:.6f},{stat.max_val:.6f},"
-                                f"{stat.mean_val:.6f},{stat.std_dev:.6f},{stat.count}\n")
-        self.stats_file.flush()
+        lines = [f"{timestamp},{key},{stat.min_val:.6f},{stat.max_val:.6f},"
+                 f"{stat.mean_val:.6f},{stat.std_dev:.6f},{stat.count}\n"
+                 for key, stat in self.stats.items()]
+        if lines:
+            self.stats_file.write(''.join(lines))
+            self.stats_file.flush()
     
     def create_layout(self) -> Layout:
         """Create enhanced Windows layout"""
@@ -415,68 +578,133 @@ class TrisonicaDataLoggerWindows:
         )
         return layout
         
-    def update_display(self, layout: Layout):
-        """Enhanced Windows display"""
-        elapsed = time.time() - self.start_time
-        runtime = str(datetime.timedelta(seconds=int(elapsed)))
+    def build_display_tables(self):
+        """Build the display tables once; update_display fills in their cells"""
+        self._header_table = Table.grid(expand=True)
+        self._header_table.add_column(justify="left", ratio=1)
+        self._header_table.add_column(justify="center", ratio=1)
+        self._header_table.add_column(justify="right", ratio=1)
+        self._header_table.add_row("", "", "")
+        self._header_table.add_row("", "", "")
+        self._header_panel = Panel(self._header_table, title="System Status", style="bold blue")
+        
+        self._stats_table = Table(title="Statistical Analysis", box=box.ROUNDED)
+        self._stats_table.add_column("Parameter", style="cyan")
+        self._stats_table.add_column("Current", style="green")
+        self._stats_table.add_column("Min", style="blue")
+        self._stats_table.add_column("Max", style="red")
+        self._stats_table.add_column("Mean", style="yellow")
+        self._stats_table.add_column("Std Dev", style="magenta")
+        self._stats_table.add_column("Count", style="white")
+        self._stats_panel = Panel(self._stats_table, title="Statistics")
+        self._stats_row_idx: Dict[str, int] = {}
+        
+        # Current measurements; rebuilt only when the parameter set changes
+        self._data_table = None
+        self._data_panel = None
+        self._data_keys = None
         
-        # Header
-        header_table = Table.grid(expand=True)
-        header_table.add_column(justify="left", ratio=1)
-        header_table.add_column(justify="center", ratio=1)
-        header_table.add_column(justify="right", ratio=1)
+        system_table = Table(title="System Info", box=box.SIMPLE)
+        system_table.add_column("Property", style="cyan")
+        system_table.add_column("Value", style="white")
+        system_table.add_row("Computer", self.system_info['computer_name'])
+        system_table.add_row("User", self.system_info['user_name'])
+        system_table.add_row("Platform", self.system_info['platform'])
+        system_table.add_row("Python", self.system_info['python_version'])
+        self._system_panel = Panel(system_table, title="System Information")
         
-        memory_usage = f"{sys.getsizeof(self.data_points) / 1024:.1f} KB"
+        footer_info = []
+        footer_info.append(f"Data: {self.log_filename}")
+        if self.config.save_statistics:
+            footer_info.append(f"Stats: {self.stats_filename}")
+        footer_info.append("Press Ctrl+C or Ctrl+Break to exit")
+        self._footer_panel = Panel(Align.center(" | ".join(footer_info)), style="dim")
+        
+    @staticmethod
+    def estimate_point_size(dp: DataPoint) -> int:
+        """Approximate bytes held by one stored DataPoint and its contents"""
+        return (sys.getsizeof(dp) + sys.getsizeof(dp.timestamp_ns) + sys.getsizeof(dp.raw_data)
+                + sys.getsizeof(dp.parsed_data) + sum(sys.getsizeof(v) for v in dp.parsed_data.values())
+                + sys.getsizeof(dp.values) + sum(sys.getsizeof(v) for v in dp.values.values()))
+                
+    @staticmethod
+    def set_table_row(table: Table, row: int, values):
+        """Overwrite the cells of an existing table row in place"""
+        for column, value in zip(table.columns, values):
+            column._cells[row] = value
+            
+    def update_display(self, layout: Layout) -> bool:
+        """Enhanced Windows display, returns False when nothing needed redrawing"""
+        now = time.time()
+        point_count = self.point_count
+        if point_count == self._last_rendered_point_count and now - self._last_render < IDLE_REFRESH_INTERVAL:
+            return False
+        self._last_rendered_point_count = point_count
+        self._last_render = now
         
-        header_table.add_row(
+        # Update rate over the last interval, from the ingest thread's sample count
+        if now - self._rate_t0 >= RATE_INTERVAL:
+            self.update_rate = (point_count - self._rate_count0) / (now - self._rate_t0)
+            self._rate_t0 = now
+            self._rate_count0 = point_count
+            
+        elapsed = now - self.start_time
+        runtime = str(datetime.timedelta(seconds=int(elapsed)))
+        
+        # Header: memory is estimated from a sampled point, refreshed every few seconds
+        stored = self.ring_size()
+        if stored and now - self._last_memory_sample >= MEMORY_SAMPLE_INTERVAL:
+            self._bytes_per_point = self.estimate_point_size(self._ring[(self._ring_head - 1) % MAX_DATAPOINTS])
+            self._last_memory_sample = now
+        memory_usage = f"{stored * self._bytes_per_point / 1024:.1f} KB"
+        
+        self.set_table_row(self._header_table, 0, (
             f"Trisonica Windows Logger - {self.system_info['computer_name']}",
             f"Runtime: {runtime}",
             f"Points: {self.point_count:,}"
-        )
-        header_table.add_row(
+        ))
+        self.set_table_row(self._header_table, 1, (
             f"Update Rate: {self.update_rate:.1f} Hz",
             f"Memory: {memory_usage}",
             f"Log: {os.path.basename(self.log_path)}"
-        )
+        ))
         
-        layout["header"].update(Panel(header_table, title="System Status", style="bold blue"))
+        layout["header"].update(self._header_panel)
         
         # Current data
-        if self.data_points:
-            latest = self.data_points[-1]
-            
-            data_table = Table(title="Current Measurements", box=box.ROUNDED)
-            data_table.add_column("Parameter", style="cyan", width=12)
-            data_table.add_column("Value", style="green", width=12)
-            data_table.add_column("Unit", style="dim", width=10)
-            data_table.add_column("Quality", style="yellow", width=12)
-            
-            for key, value in latest.parsed_data.items():
-                try:
-                    val = float(value)
-                    if key.startswith('S'):
-                        unit = "m/s"
-                        quality = "Excellent" if 0 <= val <= 50 else "Check Range"
-                    elif key.startswith('T'):
-                        unit = "°C"
-                        quality = "Excellent" if -40 <= val <= 60 else "Check Range"
-                    else:
-                        unit = ""
-                        quality = "Unknown"
-                except:
+        if stored:
+            latest = self._ring[(self._ring_head - 1) % MAX_DATAPOINTS]
+            
+            keys = tuple(latest.parsed_data)
+            if keys != self._data_keys:
+                self._data_table = Table(title="Current Measurements", box=box.ROUNDED)
+                self._data_table.add_column("Parameter", style="cyan", width=12)
+                self._data_table.add_column("Value", style="green", width=12)
+                self._data_table.add_column("Unit", style="dim", width=10)
+                self._data_table.add_column("Quality", style="yellow", width=12)
+                for key in keys:
+                    self._data_table.add_row(key, "", "", "")
+                self._data_panel = Panel(self._data_table, title="Live Data")
+                self._data_keys = keys
+            
+            for row, (key, val) in enumerate(latest.values.items()):
+                rule = QUALITY_RULES.get(key[:1])
+                if rule is not None:
+                    unit, low, high = rule
+                    quality = "Excellent" if low <= val <= high else "Check Range"
+                else:
                     unit = ""
-                    quality = "Invalid"
+                    quality = "Unknown"
                     
-                data_table.add_row(key, value, unit, quality)
+                self.set_table_row(self._data_table, row, (key, latest.parsed_data[key], unit, quality))
                 
-            layout["current_data"].update(Panel(data_table, title="Live Data"))
+            layout["current_data"].update(self._data_panel)
             
             # Raw data
             if self.config.show_raw_data:
                 raw_lines = []
-                for dp in list(self.data_points)[-8:]:
-                    timestamp = dp.timestamp.strftime('%H:%M:%S.%f')[:-3]
-                    raw_lines.append(f"{timestamp}: {dp.raw_data}")
+                for dp in self.ring_recent(8):
+                    raw_lines.append(f"{self.format_clock(dp.timestamp_ns)}: {dp.raw_data}")
                     
                 raw_text = "\n".join(raw_lines)
                 layout["raw_data"].update(Panel(raw_text, title="Raw Data Stream"))
@@ -489,17 +717,12 @@ class TrisonicaDataLoggerWindows:
             
         # Statistics
         if self.stats:
-            stats_table = Table(title="Statistical Analysis", box=box.ROUNDED)
-            stats_table.add_column("Parameter", style="cyan")
-            stats_table.add_column("Current", style="green")
-            stats_table.add_column("Min", style="blue")
-            stats_table.add_column("Max", style="red")
-            stats_table.add_column("Mean", style="yellow")
-            stats_table.add_column("Std Dev", style="magenta")
-            stats_table.add_column("Count", style="white")
-            
-            for key, stat in self.stats.items():
-                stats_table.add_row(
+            for key, stat in list(self.stats.items()):  # Ingest thread may add keys
+                row = self._stats_row_idx.get(key)
+                if row is None:
+                    row = self._stats_row_idx[key] = len(self._stats_row_idx)
+                    self._stats_table.add_row(*[""] * len(self._stats_table.columns))
+                self.set_table_row(self._stats_table, row, (
                     key,
                     f"{stat.current_val:.3f}",
                     f"{stat.min_val:.3f}",
@@ -507,33 +730,41 @@ class TrisonicaDataLoggerWindows:
                     f"{stat.mean_val:.3f}",
                     f"{stat.std_dev:.3f}",
                     f"{stat.count:,}"
-                )
+                ))
                 
-            layout["statistics"].update(Panel(stats_table, title="Statistics"))
+            layout["statistics"].update(self._stats_panel)
         else:
             layout["statistics"].update(Panel("No statistics available", title="Statistics"))
             
         # System info
-        system_table = Table(title="System Info", box=box.SIMPLE)
-        system_table.add_column("Property", style="cyan")
-        system_table.add_column("Value", style="white")
-        
-        system_table.add_row("Computer", self.system_info['computer_name'])
-        system_table.add_row("User", self.system_info['user_name'])
-        system_table.add_row("Platform", self.system_info['platform'])
-        system_table.add_row("Python", self.system_info['python_version'])
-        
-        layout["system_info"].update(Panel(system_table, title="System Information"))
+        layout["system_info"].update(self._system_panel)
             
         # Footer
-        footer_info = []
-        footer_info.append(f"Data: {self.log_filename}")
-        if self.config.save_statistics:
-            footer_info.append(f"Stats: {self.stats_filename}")
-        footer_info.append("Press Ctrl+C or Ctrl+Break to exit")
+        layout["footer"].update(self._footer_panel)
+        return True
         
-        footer_text = " | ".join(footer_info)
-        layout["footer"].update(Panel(Align.center(footer_text), style="dim"))
+    def _ingest_loop(self):
+        """Read samples as fast as they arrive, independent of the display"""
+        while self.running:
+            data_point = self.read_serial_data()
+            if data_point:
+                self.point_count += 1
+                self.ring_push(data_point)
+                
+                # Save statistics periodically
+                if self.point_count % 250 == 0:
+                    self.save_final_statistics()
+                    
+            elif self._row_buf and time.monotonic() - self._last_flush > LOG_FLUSH_INTERVAL:
+                # Read timed out: don't hold batched rows while the sensor is quiet
+                self.flush_csv_rows()
+                
+    def stop_ingest(self):
+        """Stop the ingest thread and wait for its last read to finish"""
+        self.running = False
+        if self._ingest_thread and self._ingest_thread.is_alive():
+            self._ingest_thread.join()
+        self._ingest_thread = None
         
     def run(self):
         """Main execution with Windows-optimized interface"""
@@ -543,24 +774,27 @@ class TrisonicaDataLoggerWindows:
         layout = self.create_layout()
         
         try:
-            with Live(layout, refresh_per_second=30, screen=True) as live:
+            # Refresh only after update_display: the cached tables are edited in place,
+            # so an auto-refresh thread could render one mid-update
+            with Live(layout, auto_refresh=False, screen=True) as live:
                 self.running = True
+                self._ingest_thread = threading.Thread(target=self._ingest_loop, name="ingest", daemon=True)
+                self._ingest_thread.start()
+                
+                # The main thread only renders the latest state
                 while self.running:
-                    data_point = self.read_serial_data()
-                    if data_point:
-                        self.point_count += 1
-                        self.data_points.append(data_point)
-                        
-                        # Save statistics periodically
-                        if self.point_count % 250 == 0:
-                            self.save_final_statistics()
-                            
-                    self.update_display(layout)
+                    if self.update_display(layout):
+                        live.refresh()
                     time.sleep(UPDATE_INTERVAL)
                     
         except KeyboardInterrupt:
             pass
         finally:
+            self.stop_ingest()
+            if self._read_error is not None:
+                self.console.print(f"[ERROR] Serial connection lost: {self._read_error}", style="bold red")
+            self.flush_csv_rows()
+            self.save_final_statistics()
             self.cleanup()
             
         return True
@@ -571,8 +805,11 @@ class TrisonicaDataLoggerWindows:
             self.serial_port.close()
             self.console.print("[CLEANUP] Serial port closed", style="green")
             
-        if self.log_file and not self.log_file.closed:
-            self.log_file.close()
+        if self._log_fd is not None:
+            self.flush_csv_rows()
+            os.fsync(self._log_fd)
+            os.close(self._log_fd)
+            self._log_fd = None
             self.console.print(f"[CLEANUP] Data log saved: {self.log_path}", style="green")
             
         if self.stats_file and not self.stats_file.closed:
@@ -589,11 +826,7 @@ class TrisonicaDataLoggerWindows:
             self.console.print(f"   Average Rate: {avg_rate:.1f} Hz")
             self.console.print(f"   Data Quality: {len(self.stats)} parameters tracked")
             
-            if self.config.enable_sound:
-                try:
-                    winsound.MessageBeep(winsound.MB_OK)
-                except:
-                    pass
+            self._beep('ok')
             
         self.console.print("[SUCCESS] Cleanup complete", style="bold green")
 